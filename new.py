@@ -51,14 +51,33 @@
 # This is the textbook scenario where EDF's optimality shines!
 
 import pandas as pd
-from collections import deque
+from collections import deque, namedtuple
 import heapq
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+from functools import partial, reduce
+from math import lcm
+import matplotlib
+# Charts are only written to PNG files, so use the non-interactive Agg backend
+matplotlib.use('Agg')
+matplotlib.rcParams['font.family'] = 'DejaVu Sans'
+matplotlib.rcParams['text.usetex'] = False
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from matplotlib.colors import ListedColormap
+from matplotlib.colors import ListedColormap, Normalize
+from matplotlib.cbook import boxplot_stats
+from matplotlib.ticker import FuncFormatter, MaxNLocator
 import numpy as np
 
+# Plot colors for EDF, RM and FIFO
+ALGORITHM_COLORS = ('#FF6B6B', '#4ECDC4', '#45B7D1')
+
 class Task:
+    __slots__ = ('name', 'period', 'wcet', 'deadline', 'priority')
+    
     def __init__(self, name, period, wcet, deadline):
         self.name = name
         self.period = period
@@ -70,6 +89,9 @@ class Task:
         return f"Task({self.name}, P={self.period}, C={self.wcet}, D={self.deadline})"
 
 class Job:
+    __slots__ = ('task', 'arrival_time', 'absolute_deadline', 'remaining_time', 'job_number',
+                 'start_time', 'finish_time', 'response_time', 'missed_deadline')
+    
     def __init__(self, task, arrival_time, job_number):
         self.task = task
         self.arrival_time = arrival_time
@@ -80,257 +102,308 @@ class Job:
         self.finish_time = None
         self.response_time = None
         self.missed_deadline = False
-        
-    def __lt__(self, other):
-        # For EDF: earlier deadline has higher priority
-        return self.absolute_deadline < other.absolute_deadline
     
     def __repr__(self):
         return f"{self.task.name}_{self.job_number}"
 
+# Structure-of-arrays view of all job releases, sorted by arrival time
+JobArrays = namedtuple('JobArrays', ['task_id', 'job_number', 'arrival', 'deadline', 'wcet'])
+
+# Timeline task id used for idle intervals
+IDLE_ID = -1
+
+# Ready-queue heap keys pack (priority, seq) into one int: priority << SEQ_BITS | seq
+# (seq counts pushes, at most 2 per job, so this allows ~500k jobs per run).
+# Equal keys are served in push order. For RM this matches the old stable-sorted
+# list; the old EDF heap compared deadlines only, so its order among equal
+# deadlines depended on the heap layout and is not reproduced.
+SEQ_BITS = 20
+SEQ_MASK = (1 << SEQ_BITS) - 1
+
+# Output of one scheduling run: per-job columns in release order, the
+# completion order, the timeline intervals and the total idle time
+ScheduleArrays = namedtuple('ScheduleArrays', ['start', 'finish', 'order',
+                                               'timeline_start', 'timeline_end', 'timeline_task_id',
+                                               'idle_time'])
+
+POLICIES = ('edf', 'rm', 'fifo')
+
+def simulate(arrivals, deadlines, wcets, task_ids, policy, simulation_time, task_priority):
+    """Run one scheduling policy over release-ordered job lists and return ScheduleArrays
+    
+    The policy only selects the ready-queue key: absolute deadline for EDF,
+    static task priority for RM and arrival order for (non-preemptive) FIFO.
+    The loop touches only local variables so the hot path stays cheap.
+    """
+    if policy == 'edf':
+        keys = deadlines
+    elif policy == 'rm':
+        keys = [task_priority[task_id] for task_id in task_ids]
+    elif policy == 'fifo':
+        keys = [0] * len(arrivals)
+    else:
+        raise ValueError(f"Unknown scheduling policy: {policy}")
+    preemptive = policy != 'fifo'
+    
+    num_jobs = len(arrivals)
+    remaining = list(wcets)
+    start = [-1] * num_jobs
+    finish = [-1] * num_jobs
+    # Every released job completes, so the completion order has a known size
+    order = [0] * num_jobs
+    completed = 0
+    tl_start, tl_end, tl_task = [], [], []
+    if preemptive:
+        ready = []
+        push, pop = partial(heapq.heappush, ready), partial(heapq.heappop, ready)
+    else:
+        # FIFO keys only differ by seq, so arrival order needs no heap: popleft is O(1)
+        ready = deque()
+        push, pop = ready.append, ready.popleft
+    jobs_by_seq = []  # push seq -> job index; its length is the logical clock for the next push
+    next_job = 0
+    now = 0
+    current = -1
+    current_key = 0
+    idle_time = 0
+    
+    # Event-driven: the clock jumps straight to the next arrival or completion
+    while now < simulation_time or ready or current >= 0:
+        # Add newly arrived jobs to ready queue
+        while next_job < num_jobs and arrivals[next_job] <= now:
+            push(keys[next_job] << SEQ_BITS | len(jobs_by_seq))
+            jobs_by_seq.append(next_job)
+            next_job += 1
+        
+        # If current job is done, move to completed
+        if current >= 0 and remaining[current] == 0:
+            finish[current] = now
+            order[completed] = current
+            completed += 1
+            current = -1
+        
+        # Dispatch when idle, or preempt if a higher priority job is available
+        if ready and (current < 0 or (preemptive and ready[0] >> SEQ_BITS < current_key >> SEQ_BITS)):
+            if current >= 0:
+                # A preempted job is pushed with a fresh seq, so it queues behind
+                # every equal-key job already waiting (as the old re-sorted list did)
+                current_key = (current_key >> SEQ_BITS) << SEQ_BITS | len(jobs_by_seq)
+                jobs_by_seq.append(current)
+                push(current_key)
+            current_key = pop()
+            current = jobs_by_seq[current_key & SEQ_MASK]
+            if start[current] < 0:
+                start[current] = now
+        
+        # Execute current job until it completes or (if preemptive) the next job arrives
+        next_arrival = arrivals[next_job] if next_job < num_jobs else -1
+        if current >= 0:
+            run = remaining[current]
+            if preemptive and 0 <= next_arrival - now < run:
+                run = next_arrival - now
+            remaining[current] -= run
+            task_id = task_ids[current]
+        else:
+            # Idle until the next arrival, or to the end of the simulation window
+            run = next_arrival - now if next_arrival >= 0 else max(simulation_time - now, 1)
+            task_id = IDLE_ID
+            idle_time += run
+        # Only open a new interval when the running task changes
+        if tl_task and tl_task[-1] == task_id:
+            tl_end[-1] = now + run
+        else:
+            tl_start.append(now)
+            tl_end.append(now + run)
+            tl_task.append(task_id)
+        now += run
+        
+        # Break if we've exceeded simulation time and queues are empty
+        if now >= simulation_time and not ready and current < 0:
+            break
+    
+    return ScheduleArrays(start, finish, order[:completed], tl_start, tl_end, tl_task, idle_time)
+
+def unroll_hyperperiod(sim, hyperperiod, copies):
+    """Repeat a one-hyperperiod ScheduleArrays `copies` times back to back
+    
+    Only exact when every job of the hyperperiod finished before it ended:
+    the processor is then idle at the boundary and each later hyperperiod
+    starts from the same state as the first.
+    """
+    num_jobs = len(sim.start)
+    offsets = [k * hyperperiod for k in range(copies)]
+    return ScheduleArrays(
+        start=[t + offset for offset in offsets for t in sim.start],
+        finish=[t + offset for offset in offsets for t in sim.finish],
+        order=[job + k * num_jobs for k in range(copies) for job in sim.order],
+        # Every hyperperiod starts with releases and ends idle, so no intervals merge at the seams
+        timeline_start=[t + offset for offset in offsets for t in sim.timeline_start],
+        timeline_end=[t + offset for offset in offsets for t in sim.timeline_end],
+        timeline_task_id=sim.timeline_task_id * copies,
+        idle_time=sim.idle_time * copies)
+
 class RTScheduler:
     def __init__(self, tasks, simulation_time=10000):
         self.tasks = tasks
         self.simulation_time = simulation_time
         self.current_time = 0
-        self.ready_queue = []
-        self.current_job = None
-        self.completed_jobs = []
-        self.timeline = []
+        self.idle_time = 0
+        self.completion_order = []
+        self.task_id = {task.name: idx for idx, task in enumerate(tasks)}
+        # Timeline intervals as parallel int lists: [start, end) ran task_id, merged per task run
+        self.timeline_start = []
+        self.timeline_end = []
+        self.timeline_task_id = []
         self.job_counters = {task.name: 0 for task in tasks}
         
     def generate_jobs(self):
-        """Generate all jobs for the simulation period"""
-        jobs = []
-        for task in self.tasks:
-            num_jobs = self.simulation_time // task.period
-            for i in range(num_jobs + 1):
-                arrival = i * task.period
-                if arrival < self.simulation_time:
-                    self.job_counters[task.name] += 1
-                    job = Job(task, arrival, self.job_counters[task.name])
-                    jobs.append(job)
-        return sorted(jobs, key=lambda x: x.arrival_time)
-    
-    def schedule_edf(self):
-        """EDF Scheduling Algorithm"""
-        jobs = self.generate_jobs()
-        job_queue = deque(jobs)
-        self.ready_queue = []
-        self.current_time = 0
-        self.current_job = None
-        self.completed_jobs = []
-        self.timeline = []
+        """Generate all job releases for the simulation period as arrays sorted by arrival"""
+        periods = np.array([task.period for task in self.tasks])
+        deadlines = np.array([task.deadline for task in self.tasks])
+        wcets = np.array([task.wcet for task in self.tasks])
         
-        while self.current_time < self.simulation_time or self.ready_queue or self.current_job:
-            # Add newly arrived jobs to ready queue
-            while job_queue and job_queue[0].arrival_time <= self.current_time:
-                job = job_queue.popleft()
-                heapq.heappush(self.ready_queue, job)
-            
-            # Check for deadline misses
-            for job in self.ready_queue:
-                if job.absolute_deadline < self.current_time:
-                    job.missed_deadline = True
-            
-            # If current job is done, move to completed
-            if self.current_job and self.current_job.remaining_time == 0:
-                self.current_job.finish_time = self.current_time
-                self.current_job.response_time = self.current_job.finish_time - self.current_job.arrival_time
-                if self.current_job.finish_time > self.current_job.absolute_deadline:
-                    self.current_job.missed_deadline = True
-                self.completed_jobs.append(self.current_job)
-                self.current_job = None
-            
-            # Preempt if a higher priority job is available
-            if self.ready_queue:
-                highest_priority_job = self.ready_queue[0]
-                if self.current_job is None or highest_priority_job.absolute_deadline < self.current_job.absolute_deadline:
-                    if self.current_job:
-                        heapq.heappush(self.ready_queue, self.current_job)
-                    self.current_job = heapq.heappop(self.ready_queue)
-                    if self.current_job.start_time is None:
-                        self.current_job.start_time = self.current_time
-            
-            # Execute current job
-            if self.current_job:
-                self.timeline.append({
-                    'time': self.current_time,
-                    'job': str(self.current_job),
-                    'task': self.current_job.task.name
-                })
-                self.current_job.remaining_time -= 1
-                self.current_time += 1
-            else:
-                # Idle time
-                self.timeline.append({
-                    'time': self.current_time,
-                    'job': 'IDLE',
-                    'task': 'IDLE'
-                })
-                self.current_time += 1
-                
-            # Break if we've exceeded simulation time and queues are empty
-            if self.current_time >= self.simulation_time and not self.ready_queue and not self.current_job:
-                break
+        # Task i releases at 0, P_i, 2*P_i, ... while arrival < simulation_time
+        counts = -(-self.simulation_time // periods)
+        task_id = np.repeat(np.arange(len(self.tasks)), counts)
+        job_index = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        arrival = job_index * periods[task_id]
+        self.job_counters = {task.name: int(n) for task, n in zip(self.tasks, counts)}
         
-        return self.analyze_results()
-    
-    def schedule_rm(self):
-        """Rate Monotonic Scheduling Algorithm"""
-        jobs = self.generate_jobs()
-        job_queue = deque(jobs)
-        self.ready_queue = []
-        self.current_time = 0
-        self.current_job = None
-        self.completed_jobs = []
-        self.timeline = []
+        # Stable sort keeps simultaneous releases in task order
+        order = np.argsort(arrival, kind='stable')
+        task_id = task_id[order]
+        arrival = arrival[order]
+        return JobArrays(task_id=task_id,
+                         job_number=job_index[order] + 1,
+                         arrival=arrival,
+                         deadline=arrival + deadlines[task_id],
+                         wcet=wcets[task_id])
+    
+    def run(self, policy, releases=None):
+        """Simulate one policy from POLICIES and analyze the results
         
-        while self.current_time < self.simulation_time or self.ready_queue or self.current_job:
-            # Add newly arrived jobs to ready queue
-            while job_queue and job_queue[0].arrival_time <= self.current_time:
-                job = job_queue.popleft()
-                self.ready_queue.append(job)
-            
-            # Sort ready queue by period (RM priority)
-            self.ready_queue.sort(key=lambda x: x.task.priority)
-            
-            # Check for deadline misses
-            for job in self.ready_queue:
-                if job.absolute_deadline < self.current_time:
-                    job.missed_deadline = True
-            
-            # If current job is done, move to completed
-            if self.current_job and self.current_job.remaining_time == 0:
-                self.current_job.finish_time = self.current_time
-                self.current_job.response_time = self.current_job.finish_time - self.current_job.arrival_time
-                if self.current_job.finish_time > self.current_job.absolute_deadline:
-                    self.current_job.missed_deadline = True
-                self.completed_jobs.append(self.current_job)
-                self.current_job = None
-            
-            # Preempt if a higher priority job is available
-            if self.ready_queue:
-                highest_priority_job = self.ready_queue[0]
-                if self.current_job is None or highest_priority_job.task.priority < self.current_job.task.priority:
-                    if self.current_job:
-                        self.ready_queue.append(self.current_job)
-                    self.current_job = self.ready_queue.pop(0)
-                    if self.current_job.start_time is None:
-                        self.current_job.start_time = self.current_time
-            
-            # Execute current job
-            if self.current_job:
-                self.timeline.append({
-                    'time': self.current_time,
-                    'job': str(self.current_job),
-                    'task': self.current_job.task.name
-                })
-                self.current_job.remaining_time -= 1
-                self.current_time += 1
-            else:
-                # Idle time
-                self.timeline.append({
-                    'time': self.current_time,
-                    'job': 'IDLE',
-                    'task': 'IDLE'
-                })
-                self.current_time += 1
-                
-            # Break if we've exceeded simulation time and queues are empty
-            if self.current_time >= self.simulation_time and not self.ready_queue and not self.current_job:
-                break
+        Pass releases from generate_jobs() to share one job set across policies.
+        """
+        if releases is None:
+            releases = self.generate_jobs()
+        task_priority = [task.priority for task in self.tasks]
         
+        # Periodic tasks released together at t=0 repeat their schedule every hyperperiod
+        # (LCM of the periods), so simulate one and tile it when that is exact
+        sim = None
+        hyperperiod = reduce(lcm, [task.period for task in self.tasks])
+        copies = self.simulation_time // hyperperiod
+        if copies > 1 and self.simulation_time % hyperperiod == 0:
+            block = int(np.searchsorted(releases.arrival, hyperperiod))
+            first = simulate(releases.arrival[:block].tolist(), releases.deadline[:block].tolist(),
+                             releases.wcet[:block].tolist(), releases.task_id[:block].tolist(),
+                             policy, hyperperiod, task_priority)
+            if max(first.finish) < hyperperiod:
+                sim = unroll_hyperperiod(first, hyperperiod, copies)
+        if sim is None:
+            sim = simulate(releases.arrival.tolist(), releases.deadline.tolist(), releases.wcet.tolist(),
+                           releases.task_id.tolist(), policy, self.simulation_time, task_priority)
+        
+        # Per-job columns indexed by release order
+        self.job_arr = {
+            'task_id': releases.task_id.astype(np.int8),
+            'job_number': releases.job_number,
+            'arrival': releases.arrival.astype(np.int32),
+            'deadline': releases.deadline.astype(np.int32),
+            'start': np.array(sim.start, dtype=np.int32),
+            'finish': np.array(sim.finish, dtype=np.int32)
+        }
+        # Every job runs to completion, so a miss is simply finishing after the deadline
+        self.job_arr['missed'] = self.job_arr['finish'] > self.job_arr['deadline']
+        self.completion_order = sim.order
+        self.timeline_start = sim.timeline_start
+        self.timeline_end = sim.timeline_end
+        self.timeline_task_id = sim.timeline_task_id
+        self.current_time = sim.timeline_end[-1] if sim.timeline_end else 0
+        self.idle_time = sim.idle_time
         return self.analyze_results()
     
-    def schedule_fifo(self):
+    def schedule_edf(self, releases=None):
+        """EDF Scheduling Algorithm"""
+        return self.run('edf', releases)
+    
+    def schedule_rm(self, releases=None):
+        """Rate Monotonic Scheduling Algorithm"""
+        return self.run('rm', releases)
+    
+    def schedule_fifo(self, releases=None):
         """First In First Out Scheduling Algorithm (Non-preemptive)"""
-        jobs = self.generate_jobs()
-        job_queue = deque(jobs)
-        self.ready_queue = []
-        self.current_time = 0
-        self.current_job = None
-        self.completed_jobs = []
-        self.timeline = []
-        
-        while self.current_time < self.simulation_time or self.ready_queue or self.current_job:
-            # Add newly arrived jobs to ready queue
-            while job_queue and job_queue[0].arrival_time <= self.current_time:
-                job = job_queue.popleft()
-                self.ready_queue.append(job)
-            
-            # Check for deadline misses
-            for job in self.ready_queue:
-                if job.absolute_deadline < self.current_time:
-                    job.missed_deadline = True
-            
-            # If current job is done, move to completed
-            if self.current_job and self.current_job.remaining_time == 0:
-                self.current_job.finish_time = self.current_time
-                self.current_job.response_time = self.current_job.finish_time - self.current_job.arrival_time
-                if self.current_job.finish_time > self.current_job.absolute_deadline:
-                    self.current_job.missed_deadline = True
-                self.completed_jobs.append(self.current_job)
-                self.current_job = None
-            
-            # FIFO: No preemption - select next job only when current is done
-            if self.current_job is None and self.ready_queue:
-                self.current_job = self.ready_queue.pop(0)  # First come, first served
-                if self.current_job.start_time is None:
-                    self.current_job.start_time = self.current_time
-            
-            # Execute current job
-            if self.current_job:
-                self.timeline.append({
-                    'time': self.current_time,
-                    'job': str(self.current_job),
-                    'task': self.current_job.task.name
-                })
-                self.current_job.remaining_time -= 1
-                self.current_time += 1
-            else:
-                # Idle time
-                self.timeline.append({
-                    'time': self.current_time,
-                    'job': 'IDLE',
-                    'task': 'IDLE'
-                })
-                self.current_time += 1
-                
-            # Break if we've exceeded simulation time and queues are empty
-            if self.current_time >= self.simulation_time and not self.ready_queue and not self.current_job:
-                break
-        
-        return self.analyze_results()
+        return self.run('fifo', releases)
+    
+    def _job_records(self, jobs):
+        """Build Job objects for the completed jobs (used by the reports and plots)"""
+        records = []
+        for task_id, number, arrival, start, finish, missed in zip(
+                jobs['task_id'].tolist(), jobs['job_number'].tolist(), jobs['arrival'].tolist(),
+                jobs['start'].tolist(), jobs['finish'].tolist(), jobs['missed'].tolist()):
+            job = Job(self.tasks[task_id], arrival, number)
+            job.remaining_time = 0
+            job.start_time = start
+            job.finish_time = finish
+            job.response_time = finish - arrival
+            job.missed_deadline = missed
+            records.append(job)
+        return records
     
     def analyze_results(self):
         """Analyze scheduling results"""
-        total_jobs = len(self.completed_jobs)
-        missed_deadlines = sum(1 for job in self.completed_jobs if job.missed_deadline)
+        # Per-job columns in completion order; this is the one per-job table that the CSV
+        # export and every visualization reduce over (bincount/masks), built once per run
+        order = np.array(self.completion_order, dtype=np.intp)
+        jobs = {key: column[order] for key, column in self.job_arr.items()}
+        jobs['response'] = jobs['finish'] - jobs['arrival']
+        response = jobs['response']
+        
+        total_jobs = len(order)
+        missed_deadlines = int(np.count_nonzero(jobs['missed']))
         
         if total_jobs > 0:
-            avg_response_time = sum(job.response_time for job in self.completed_jobs if job.response_time) / total_jobs
-            max_response_time = max((job.response_time for job in self.completed_jobs if job.response_time), default=0)
-            min_response_time = min((job.response_time for job in self.completed_jobs if job.response_time), default=0)
+            positive = response[response > 0]
+            avg_response_time = int(positive.sum()) / total_jobs
+            max_response_time = int(positive.max()) if positive.size else 0
+            min_response_time = int(positive.min()) if positive.size else 0
+            # Jitter (std dev) and coefficient of variation of the non-zero response times
+            response_jitter = float(np.std(positive)) if positive.size else 0
+            response_cv = response_jitter / float(np.mean(positive)) * 100 if positive.size else 0
         else:
             avg_response_time = 0
             max_response_time = 0
             min_response_time = 0
+            response_jitter = 0
+            response_cv = 0
+        
+        timeline = {
+            'start': np.array(self.timeline_start, dtype=np.int32),
+            'end': np.array(self.timeline_end, dtype=np.int32),
+            'task_id': np.array(self.timeline_task_id, dtype=np.int8)
+        }
         
-        # Calculate CPU utilization
-        idle_time = sum(1 for entry in self.timeline if entry['job'] == 'IDLE')
-        cpu_utilization = ((len(self.timeline) - idle_time) / len(self.timeline)) * 100 if self.timeline else 0
+        # Calculate CPU utilization over the simulated span (idle time is counted while scheduling)
+        elapsed = self.current_time
+        cpu_utilization = ((elapsed - self.idle_time) / elapsed) * 100 if elapsed else 0
         
         # Per-task statistics
+        num_tasks = len(self.tasks)
+        task_ids = jobs['task_id']
+        task_counts = np.bincount(task_ids, minlength=num_tasks)
+        task_missed = np.bincount(task_ids, weights=jobs['missed'], minlength=num_tasks)
+        task_response_sum = np.bincount(task_ids, weights=response, minlength=num_tasks)
+        task_response_max = np.zeros(num_tasks, dtype=response.dtype)
+        np.maximum.at(task_response_max, task_ids, response)
+        
         task_stats = {}
-        for task in self.tasks:
-            task_jobs = [job for job in self.completed_jobs if job.task.name == task.name]
-            if task_jobs:
+        for task_id, task in enumerate(self.tasks):
+            if task_counts[task_id]:
                 task_stats[task.name] = {
-                    'total_jobs': len(task_jobs),
-                    'missed_deadlines': sum(1 for job in task_jobs if job.missed_deadline),
-                    'avg_response_time': sum(job.response_time for job in task_jobs if job.response_time) / len(task_jobs),
-                    'max_response_time': max((job.response_time for job in task_jobs if job.response_time), default=0)
+                    'total_jobs': int(task_counts[task_id]),
+                    'missed_deadlines': int(task_missed[task_id]),
+                    'avg_response_time': float(task_response_sum[task_id]) / int(task_counts[task_id]),
+                    'max_response_time': int(task_response_max[task_id])
                 }
         
         return {
@@ -339,10 +412,14 @@ class RTScheduler:
             'avg_response_time': avg_response_time,
             'max_response_time': max_response_time,
             'min_response_time': min_response_time,
+            'response_jitter': response_jitter,
+            'response_cv': response_cv,
             'cpu_utilization': cpu_utilization,
             'task_stats': task_stats,
-            'timeline': self.timeline,
-            'completed_jobs': self.completed_jobs
+            'timeline': timeline,
+            'task_names': [task.name for task in self.tasks],
+            'jobs': jobs,
+            'completed_jobs': self._job_records(jobs)
         }
 
 def main():
@@ -387,12 +464,15 @@ def main():
     
     simulation_time = 30000  # 30 seconds
     
+    # The job releases are the same for every policy, so generate them once
+    releases = RTScheduler(tasks, simulation_time).generate_jobs()
+    
     # Run EDF scheduling
     print("=" * 60)
     print("EDF (Earliest Deadline First) Scheduling")
     print("=" * 60)
     scheduler_edf = RTScheduler(tasks, simulation_time)
-    results_edf = scheduler_edf.schedule_edf()
+    results_edf = scheduler_edf.schedule_edf(releases)
     
     print(f"Total Jobs Completed: {results_edf['total_jobs']}")
     print(f"Missed Deadlines: {results_edf['missed_deadlines']}")
@@ -414,7 +494,7 @@ def main():
     print("RM (Rate Monotonic) Scheduling")
     print("=" * 60)
     scheduler_rm = RTScheduler(tasks, simulation_time)
-    results_rm = scheduler_rm.schedule_rm()
+    results_rm = scheduler_rm.schedule_rm(releases)
     
     print(f"Total Jobs Completed: {results_rm['total_jobs']}")
     print(f"Missed Deadlines: {results_rm['missed_deadlines']}")
@@ -436,7 +516,7 @@ def main():
     print("FIFO (First In First Out) Scheduling")
     print("=" * 60)
     scheduler_fifo = RTScheduler(tasks, simulation_time)
-    results_fifo = scheduler_fifo.schedule_fifo()
+    results_fifo = scheduler_fifo.schedule_fifo(releases)
     
     print(f"Total Jobs Completed: {results_fifo['total_jobs']}")
     print(f"Missed Deadlines: {results_fifo['missed_deadlines']}")
@@ -522,85 +602,90 @@ def export_results_to_csv(results_edf, results_rm, results_fifo):
     
     # Job details for each algorithm
     for algo_name, results in [('EDF', results_edf), ('RM', results_rm), ('FIFO', results_fifo)]:
-        job_data = []
-        for job in results['completed_jobs']:
-            job_data.append({
-                'Job': str(job),
-                'Task': job.task.name,
-                'Arrival_Time': job.arrival_time,
-                'Start_Time': job.start_time,
-                'Finish_Time': job.finish_time,
-                'Deadline': job.absolute_deadline,
-                'Response_Time': job.response_time,
-                'Missed_Deadline': job.missed_deadline
-            })
-        df_jobs = pd.DataFrame(job_data)
+        jobs = results['jobs']
+        task_names = pd.Categorical.from_codes(jobs['task_id'], categories=results['task_names'])
+        df_jobs = pd.DataFrame({
+            'Job': [f"{name}_{number}" for name, number in zip(task_names, jobs['job_number'].tolist())],
+            'Task': task_names,
+            'Arrival_Time': jobs['arrival'],
+            'Start_Time': jobs['start'],
+            'Finish_Time': jobs['finish'],
+            'Deadline': jobs['deadline'],
+            'Response_Time': jobs['response'],
+            'Missed_Deadline': jobs['missed']
+        })
         df_jobs.to_csv(f'{algo_name.lower()}_job_details.csv', index=False)
 
+# Fast zlib level for the PNG encoder; the files grow a little but encode several times faster
+PNG_COMPRESS_LEVEL = 1
+
+def save_png(filename, **savefig_kwargs):
+    """Save the current figure as PNG, encoding in memory and writing the file in one call"""
+    buf = io.BytesIO()
+    savefig_kwargs.setdefault('pil_kwargs', {'compress_level': PNG_COMPRESS_LEVEL})
+    plt.savefig(buf, format='png', **savefig_kwargs)
+    Path(filename).write_bytes(buf.getvalue())
+
+def pooled_figure(figsize, layout=None):
+    """Return a cleared figure of the given size, reusing the one from an earlier plot if present"""
+    # Clear the whole figure rather than ax.clear() on the old axes: cleared axes keep
+    # their tight_layout position and some per-axes state, which shifts the next plot
+    fig = plt.figure(num=f'pool-{figsize[0]}x{figsize[1]}', figsize=figsize)
+    fig.clear()
+    fig.set_layout_engine(layout)
+    return fig
+
+def pooled_subplots(nrows=1, ncols=1, figsize=None, layout='constrained', **subplot_kwargs):
+    """plt.subplots() on a pooled figure, so plots of the same shape share one canvas.
+
+    Figures are laid out by the constrained layout engine while drawing, so plots do not
+    need a separate tight_layout() pass; pass layout=None to lay the figure out by hand.
+    """
+    fig = pooled_figure(figsize, layout)
+    return fig, fig.subplots(nrows, ncols, **subplot_kwargs)
+
 def visualize_gantt_chart(results, algorithm_name, max_time=2000):
     """Create a Gantt chart showing task execution timeline"""
-    fig, ax = plt.subplots(figsize=(18, 6))
+    fig, ax = pooled_subplots(figsize=(18, 6))
     
     # Color map for different tasks
     colors = {'Ultra': '#FF6B6B', 'Sound': '#4ECDC4', 'PIR': '#45B7D1', 'Button': '#FFA07A', 'IDLE': '#E8E8E8'}
     # Marker styles for different tasks
     markers = {'Ultra': 's', 'Sound': 'o', 'PIR': '^', 'Button': 'D'}  # square, circle, triangle, diamond
     
-    # Get timeline up to max_time
-    timeline = [entry for entry in results['timeline'] if entry['time'] < max_time]
+    # Get timeline intervals that start before max_time, clipped to the window
+    timeline = results['timeline']
+    shown = timeline['start'] < max_time
+    starts = timeline['start'][shown]
+    ends = np.minimum(timeline['end'][shown], max_time)
+    shown_task_ids = timeline['task_id'][shown]
     
     # Create a mapping of tasks to y-positions
     task_names = ['Ultra', 'Sound', 'PIR', 'Button']
     task_to_y = {task: idx for idx, task in enumerate(task_names)}
+    task_ids = {task: idx for idx, task in enumerate(results['task_names'])}
     
-    # Track job executions for scatter plot
-    task_executions = {task: [] for task in task_names}
-    
-    # Group consecutive same tasks for background shading
-    if timeline:
-        current_task = timeline[0]['task']
-        start_time = timeline[0]['time']
+    for task in task_names:
+        mask = shown_task_ids == task_ids.get(task, IDLE_ID)
+        if not mask.any():
+            continue
+        # Each timeline interval is one continuous execution burst of the task
+        task_starts = starts[mask]
+        lengths = ends[mask] - task_starts
         
-        for entry in timeline:
-            if entry['task'] != 'IDLE' and entry['task'] in task_names:
-                task_executions[entry['task']].append(entry['time'])
+        # Draw subtle background bars
+        ax.barh(task_to_y[task], lengths, left=task_starts, height=0.6, 
+               color=colors[task], alpha=0.15, edgecolor='none')
         
-        # Plot background regions for continuous task execution periods
-        i = 0
-        while i < len(timeline):
-            if timeline[i]['task'] != 'IDLE':
-                task = timeline[i]['task']
-                if task in task_names:
-                    start = timeline[i]['time']
-                    # Find end of this execution burst
-                    j = i
-                    while j < len(timeline) and timeline[j]['task'] == task:
-                        j += 1
-                    end = timeline[j-1]['time'] + 1
-                    
-                    # Draw subtle background bar
-                    y_pos = task_to_y[task]
-                    ax.barh(y_pos, end - start, left=start, height=0.6, 
-                           color=colors[task], alpha=0.15, edgecolor='none')
-                    i = j
-                else:
-                    i += 1
-            else:
-                i += 1
-    
-    # Plot execution points as scatter
-    for task in task_names:
-        if task_executions[task]:
+        # Expand the bursts into per-ms execution points for the scatter
+        offsets = np.repeat(task_starts - (np.cumsum(lengths) - lengths), lengths)
+        times = offsets + np.arange(offsets.size)
+        if times.size > 500:
             # Sample points to avoid overcrowding (take every Nth point based on density)
-            times = task_executions[task]
-            if len(times) > 500:
-                # If too many points, sample them
-                step = len(times) // 500
-                times = times[::step]
-            
-            y_positions = [task_to_y[task]] * len(times)
-            ax.scatter(times, y_positions, c=colors[task], marker=markers[task], 
-                      s=30, edgecolors='black', linewidths=0.5, alpha=0.8, zorder=3)
+            times = times[::times.size // 500]
+        
+        ax.scatter(times, np.full(times.size, task_to_y[task]), c=colors[task], marker=markers[task], 
+                  s=30, edgecolors='black', linewidths=0.5, alpha=0.8, zorder=3, rasterized=True)
     
     # Formatting
     ax.set_xlabel('Time (ms)', fontsize=13, fontweight='bold')
@@ -636,143 +721,107 @@ def visualize_gantt_chart(results, algorithm_name, max_time=2000):
            fontsize=9, verticalalignment='top',
            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
     
-    plt.tight_layout()
-    plt.savefig(f'{algorithm_name.lower()}_gantt_chart.png', dpi=300, bbox_inches='tight')
+    save_png(f'{algorithm_name.lower()}_gantt_chart.png', dpi=300)
     print(f"Saved {algorithm_name.lower()}_gantt_chart.png")
 
 def visualize_comparison_metrics(results_edf, results_rm, results_fifo):
     """Create bar charts comparing different metrics across algorithms"""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig, axes = pooled_subplots(2, 2, figsize=(14, 10))
     
     algorithms = ['EDF', 'RM', 'FIFO']
-    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+    colors = ALGORITHM_COLORS
     
     # 1. Missed Deadlines
     missed = [results_edf['missed_deadlines'], results_rm['missed_deadlines'], results_fifo['missed_deadlines']]
-    axes[0, 0].bar(algorithms, missed, color=colors, edgecolor='black', linewidth=1.5)
+    bars = axes[0, 0].bar(algorithms, missed, color=colors, edgecolor='black', linewidth=1.5)
     axes[0, 0].set_title('Missed Deadlines Comparison', fontsize=12, fontweight='bold')
     axes[0, 0].set_ylabel('Number of Missed Deadlines', fontsize=10)
     axes[0, 0].grid(axis='y', alpha=0.3)
-    for i, v in enumerate(missed):
-        axes[0, 0].text(i, v + max(missed)*0.02, str(v), ha='center', va='bottom', fontweight='bold')
+    axes[0, 0].bar_label(bars, labels=[str(v) for v in missed], padding=3, fontweight='bold')
     
     # 2. Average Response Time
     avg_rt = [results_edf['avg_response_time'], results_rm['avg_response_time'], results_fifo['avg_response_time']]
-    axes[0, 1].bar(algorithms, avg_rt, color=colors, edgecolor='black', linewidth=1.5)
+    bars = axes[0, 1].bar(algorithms, avg_rt, color=colors, edgecolor='black', linewidth=1.5)
     axes[0, 1].set_title('Average Response Time Comparison', fontsize=12, fontweight='bold')
     axes[0, 1].set_ylabel('Avg Response Time (ms)', fontsize=10)
     axes[0, 1].grid(axis='y', alpha=0.3)
-    for i, v in enumerate(avg_rt):
-        axes[0, 1].text(i, v + max(avg_rt)*0.02, f'{v:.1f}', ha='center', va='bottom', fontweight='bold')
+    axes[0, 1].bar_label(bars, labels=[f'{v:.1f}' for v in avg_rt], padding=3, fontweight='bold')
     
     # 3. CPU Utilization
     cpu_util = [results_edf['cpu_utilization'], results_rm['cpu_utilization'], results_fifo['cpu_utilization']]
-    axes[1, 0].bar(algorithms, cpu_util, color=colors, edgecolor='black', linewidth=1.5)
+    bars = axes[1, 0].bar(algorithms, cpu_util, color=colors, edgecolor='black', linewidth=1.5)
     axes[1, 0].set_title('CPU Utilization Comparison', fontsize=12, fontweight='bold')
     axes[1, 0].set_ylabel('CPU Utilization (%)', fontsize=10)
     axes[1, 0].set_ylim(0, 100)
     axes[1, 0].grid(axis='y', alpha=0.3)
-    for i, v in enumerate(cpu_util):
-        axes[1, 0].text(i, v + 2, f'{v:.1f}%', ha='center', va='bottom', fontweight='bold')
+    axes[1, 0].bar_label(bars, labels=[f'{v:.1f}%' for v in cpu_util], padding=3, fontweight='bold')
     
     # 4. Max Response Time
     max_rt = [results_edf['max_response_time'], results_rm['max_response_time'], results_fifo['max_response_time']]
-    axes[1, 1].bar(algorithms, max_rt, color=colors, edgecolor='black', linewidth=1.5)
+    bars = axes[1, 1].bar(algorithms, max_rt, color=colors, edgecolor='black', linewidth=1.5)
     axes[1, 1].set_title('Maximum Response Time Comparison', fontsize=12, fontweight='bold')
     axes[1, 1].set_ylabel('Max Response Time (ms)', fontsize=10)
     axes[1, 1].grid(axis='y', alpha=0.3)
-    for i, v in enumerate(max_rt):
-        axes[1, 1].text(i, v + max(max_rt)*0.02, f'{v:.1f}', ha='center', va='bottom', fontweight='bold')
+    axes[1, 1].bar_label(bars, labels=[f'{v:.1f}' for v in max_rt], padding=3, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig('scheduling_comparison_metrics.png', dpi=300, bbox_inches='tight')
+    save_png('scheduling_comparison_metrics.png', dpi=300)
     print(f"Saved scheduling_comparison_metrics.png")
 
+def _collect_task_matrix(results_list, tasks, metrics):
+    """Stack per-task statistics into an (algorithms, tasks, metrics) array"""
+    return np.array([[[results['task_stats'][t][m] for m in metrics] for t in tasks]
+                     for results in results_list])
+
 def visualize_task_statistics(results_edf, results_rm, results_fifo):
     """Create per-task comparison charts"""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig, axes = pooled_subplots(2, 2, figsize=(14, 10))
     
     tasks = ['Ultra', 'Sound', 'PIR', 'Button']
     algorithms = ['EDF', 'RM', 'FIFO']
+    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
     
     x = np.arange(len(tasks))
     width = 0.25
     
-    # 1. Missed Deadlines per Task
-    edf_missed = [results_edf['task_stats'][t]['missed_deadlines'] for t in tasks]
-    rm_missed = [results_rm['task_stats'][t]['missed_deadlines'] for t in tasks]
-    fifo_missed = [results_fifo['task_stats'][t]['missed_deadlines'] for t in tasks]
-    
-    axes[0, 0].bar(x - width, edf_missed, width, label='EDF', color='#FF6B6B', edgecolor='black')
-    axes[0, 0].bar(x, rm_missed, width, label='RM', color='#4ECDC4', edgecolor='black')
-    axes[0, 0].bar(x + width, fifo_missed, width, label='FIFO', color='#45B7D1', edgecolor='black')
-    axes[0, 0].set_title('Missed Deadlines by Task', fontsize=12, fontweight='bold')
-    axes[0, 0].set_ylabel('Missed Deadlines', fontsize=10)
-    axes[0, 0].set_xticks(x)
-    axes[0, 0].set_xticklabels(tasks)
-    axes[0, 0].legend()
-    axes[0, 0].grid(axis='y', alpha=0.3)
-    
-    # 2. Average Response Time per Task
-    edf_rt = [results_edf['task_stats'][t]['avg_response_time'] for t in tasks]
-    rm_rt = [results_rm['task_stats'][t]['avg_response_time'] for t in tasks]
-    fifo_rt = [results_fifo['task_stats'][t]['avg_response_time'] for t in tasks]
-    
-    axes[0, 1].bar(x - width, edf_rt, width, label='EDF', color='#FF6B6B', edgecolor='black')
-    axes[0, 1].bar(x, rm_rt, width, label='RM', color='#4ECDC4', edgecolor='black')
-    axes[0, 1].bar(x + width, fifo_rt, width, label='FIFO', color='#45B7D1', edgecolor='black')
-    axes[0, 1].set_title('Average Response Time by Task', fontsize=12, fontweight='bold')
-    axes[0, 1].set_ylabel('Avg Response Time (ms)', fontsize=10)
-    axes[0, 1].set_xticks(x)
-    axes[0, 1].set_xticklabels(tasks)
-    axes[0, 1].legend()
-    axes[0, 1].grid(axis='y', alpha=0.3)
-    
-    # 3. Max Response Time per Task
-    edf_max = [results_edf['task_stats'][t]['max_response_time'] for t in tasks]
-    rm_max = [results_rm['task_stats'][t]['max_response_time'] for t in tasks]
-    fifo_max = [results_fifo['task_stats'][t]['max_response_time'] for t in tasks]
-    
-    axes[1, 0].bar(x - width, edf_max, width, label='EDF', color='#FF6B6B', edgecolor='black')
-    axes[1, 0].bar(x, rm_max, width, label='RM', color='#4ECDC4', edgecolor='black')
-    axes[1, 0].bar(x + width, fifo_max, width, label='FIFO', color='#45B7D1', edgecolor='black')
-    axes[1, 0].set_title('Maximum Response Time by Task', fontsize=12, fontweight='bold')
-    axes[1, 0].set_ylabel('Max Response Time (ms)', fontsize=10)
-    axes[1, 0].set_xticks(x)
-    axes[1, 0].set_xticklabels(tasks)
-    axes[1, 0].legend()
-    axes[1, 0].grid(axis='y', alpha=0.3)
-    
-    # 4. Total Jobs per Task
-    edf_jobs = [results_edf['task_stats'][t]['total_jobs'] for t in tasks]
-    rm_jobs = [results_rm['task_stats'][t]['total_jobs'] for t in tasks]
-    fifo_jobs = [results_fifo['task_stats'][t]['total_jobs'] for t in tasks]
-    
-    axes[1, 1].bar(x - width, edf_jobs, width, label='EDF', color='#FF6B6B', edgecolor='black')
-    axes[1, 1].bar(x, rm_jobs, width, label='RM', color='#4ECDC4', edgecolor='black')
-    axes[1, 1].bar(x + width, fifo_jobs, width, label='FIFO', color='#45B7D1', edgecolor='black')
-    axes[1, 1].set_title('Total Jobs Completed by Task', fontsize=12, fontweight='bold')
-    axes[1, 1].set_ylabel('Number of Jobs', fontsize=10)
-    axes[1, 1].set_xticks(x)
-    axes[1, 1].set_xticklabels(tasks)
-    axes[1, 1].legend()
-    axes[1, 1].grid(axis='y', alpha=0.3)
+    # (subplot, metric, title, y label) for each panel
+    panels = [
+        ((0, 0), 'missed_deadlines', 'Missed Deadlines by Task', 'Missed Deadlines'),
+        ((0, 1), 'avg_response_time', 'Average Response Time by Task', 'Avg Response Time (ms)'),
+        ((1, 0), 'max_response_time', 'Maximum Response Time by Task', 'Max Response Time (ms)'),
+        ((1, 1), 'total_jobs', 'Total Jobs Completed by Task', 'Number of Jobs')
+    ]
+    matrix = _collect_task_matrix([results_edf, results_rm, results_fifo], tasks,
+                                  [metric for _, metric, _, _ in panels])
+    
+    for k, (pos, _, title, ylabel) in enumerate(panels):
+        ax = axes[pos]
+        for i, (algo, color) in enumerate(zip(algorithms, colors)):
+            ax.bar(x + (i - 1) * width, matrix[i, :, k], width, label=algo, color=color, edgecolor='black')
+        ax.set_title(title, fontsize=12, fontweight='bold')
+        ax.set_ylabel(ylabel, fontsize=10)
+        ax.set_xticks(x)
+        ax.set_xticklabels(tasks)
+        ax.legend()
+        ax.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('task_statistics_comparison.png', dpi=300, bbox_inches='tight')
+    save_png('task_statistics_comparison.png', dpi=300)
     print(f"Saved task_statistics_comparison.png")
 
 def visualize_response_time_distribution(results_edf, results_rm, results_fifo):
     """Create response time distribution histograms"""
-    fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+    fig, axes = pooled_subplots(1, 3, figsize=(16, 5))
     
     algorithms = [('EDF', results_edf), ('RM', results_rm), ('FIFO', results_fifo)]
-    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+    colors = ALGORITHM_COLORS
     
     for idx, (name, results) in enumerate(algorithms):
-        response_times = [job.response_time for job in results['completed_jobs'] if job.response_time]
+        response_times = results['jobs']['response']
+        response_times = response_times[response_times != 0]
         
-        axes[idx].hist(response_times, bins=30, color=colors[idx], edgecolor='black', alpha=0.7)
+        # One filled step patch instead of a Rectangle per bin
+        counts, edges = np.histogram(response_times, bins=30)
+        axes[idx].stairs(counts, edges, fill=True, facecolor=colors[idx], edgecolor='black',
+                         alpha=0.7, linewidth=1)
         axes[idx].set_title(f'{name} Response Time Distribution', fontsize=12, fontweight='bold')
         axes[idx].set_xlabel('Response Time (ms)', fontsize=10)
         axes[idx].set_ylabel('Frequency', fontsize=10)
@@ -781,8 +830,7 @@ def visualize_response_time_distribution(results_edf, results_rm, results_fifo):
         axes[idx].legend()
         axes[idx].grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('response_time_distribution.png', dpi=300, bbox_inches='tight')
+    save_png('response_time_distribution.png', dpi=300)
     print(f"Saved response_time_distribution.png")
 
 def calculate_utility(job, utility_type='hard'):
@@ -846,98 +894,128 @@ def calculate_utility(job, utility_type='hard'):
     
     return 1.0
 
-def get_task_traffic_class(task_name):
-    """Classify tasks as delay-sensitive or delay-tolerant"""
-    delay_sensitive_tasks = ['PIR', 'Button', 'Ultra']  # Critical, emergency, collision avoidance
-    delay_tolerant_tasks = ['Sound']  # Monitoring, analysis - can tolerate delays
+def calculate_utilities(jobs, utility_type='hard'):
+    """Vectorized calculate_utility over the per-job columns in results['jobs'].
+
+    Utilities lie in [0, 1] and only feed the plots, so they are returned as float32.
+    """
+    lateness = (jobs['finish'] - jobs['deadline']).astype(np.float32)
+    deadline = (jobs['deadline'] - jobs['arrival']).astype(np.float32)  # Relative (task) deadline
+    latency = jobs['response'].astype(np.float32)
+    on_time = lateness <= 0
     
-    if task_name in delay_sensitive_tasks:
-        return 'delay_sensitive'
-    elif task_name in delay_tolerant_tasks:
-        return 'delay_tolerant'
+    if utility_type == 'hard':
+        utility = np.where(on_time, 1.0, 0.0)
+    elif utility_type == 'soft':
+        utility = np.where(on_time, 1.0, np.exp(-np.maximum(lateness, 0) / deadline))
+    elif utility_type == 'firm':
+        slack = -lateness
+        utility = np.where(on_time, 1.0 - (0.3 * (deadline - slack) / deadline), 0.0)
+    elif utility_type == 'delay_sensitive':
+        utility = np.select([latency < deadline * 0.7, latency <= deadline], [1.0, 0.3], 0.0)
+    elif utility_type == 'delay_tolerant':
+        utility = np.maximum(0, np.exp(-0.3 * (latency / (deadline * 0.5))))
     else:
-        return 'delay_sensitive'  # Default to sensitive for safety
+        utility = np.ones(len(latency))
+    
+    return utility.astype(np.float32, copy=False)
+
+def compute_utility_table(results_edf, results_rm, results_fifo, utility_types=('hard', 'soft', 'firm')):
+    """Per-job utilities for every (algorithm, utility_type), computed once for all utility plots"""
+    algorithms = [('EDF', results_edf), ('RM', results_rm), ('FIFO', results_fifo)]
+    return {(name, utility_type): calculate_utilities(results['jobs'], utility_type)
+            for name, results in algorithms for utility_type in utility_types}
+
+# Row of each task in the per-task plots (miss timeline, heatmap, success rates)
+TASK_ROW = {'Ultra': 0, 'PIR': 1, 'Button': 2, 'Sound': 3}
+
+# M2M traffic class of each sensor task
+_TRAFFIC_CLASS = {
+    'PIR': 'delay_sensitive',     # Critical, emergency, collision avoidance
+    'Button': 'delay_sensitive',
+    'Ultra': 'delay_sensitive',
+    'Sound': 'delay_tolerant'     # Monitoring, analysis - can tolerate delays
+}
+
+def get_task_traffic_class(task_name):
+    """Classify tasks as delay-sensitive or delay-tolerant"""
+    return _TRAFFIC_CLASS.get(task_name, 'delay_sensitive')  # Default to sensitive for safety
 
-def visualize_utility_curves(results_edf, results_rm, results_fifo):
+def _traffic_class_masks(results):
+    """Per-job delay-sensitive and delay-tolerant masks, classifying each task once"""
+    task_classes = [_TRAFFIC_CLASS.get(name) for name in results['task_names']]
+    sensitive = np.array([cls == 'delay_sensitive' for cls in task_classes], dtype=bool)
+    tolerant = np.array([cls == 'delay_tolerant' for cls in task_classes], dtype=bool)
+    task_ids = results['jobs']['task_id']
+    return sensitive[task_ids], tolerant[task_ids]
+
+def _style_utility_axis(ax, title, max_label=None):
+    """Shared styling for the average-utility (%) bar panels"""
+    ax.set_title(title, fontsize=12, fontweight='bold')
+    ax.set_ylabel('Average Utility (%)', fontsize=10)
+    ax.set_ylim(0, 105)
+    ax.grid(axis='y', alpha=0.3)
+    ax.axhline(y=100, color='green', linestyle='--', alpha=0.5, label=max_label)
+
+# Theoretical utility curves over time relative to the deadline (constant, so built once)
+_THEO_TIME = np.linspace(-50, 150, 201, dtype=np.float32)  # 1 ms steps, so t=0 is a sample
+_THEO_HARD = np.where(_THEO_TIME <= 0, 1.0, 0.0)
+_THEO_SOFT = np.where(_THEO_TIME <= 0, 1.0, np.exp(-_THEO_TIME / 50))
+_THEO_FIRM = np.clip(np.where(_THEO_TIME <= 0, 0.7 + 0.3 * (1 - _THEO_TIME / (-50)), 0.0), 0, 1)
+
+def visualize_utility_curves(results_edf, results_rm, results_fifo, utilities=None):
     """Visualize utility curves for different real-time models"""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    if utilities is None:
+        utilities = compute_utility_table(results_edf, results_rm, results_fifo)
+    fig, axes = pooled_subplots(2, 2, figsize=(14, 10))
     
-    algorithms = [('EDF', results_edf, '#FF6B6B'), 
-                  ('RM', results_rm, '#4ECDC4'), 
-                  ('FIFO', results_fifo, '#45B7D1')]
+    algorithms = list(zip(('EDF', 'RM', 'FIFO'), (results_edf, results_rm, results_fifo), ALGORITHM_COLORS))
     
     utility_types = ['hard', 'soft', 'firm']
     
     # 1. Hard Real-Time Utility
     ax = axes[0, 0]
     for name, results, color in algorithms:
-        utilities = [calculate_utility(job, 'hard') for job in results['completed_jobs']]
-        avg_utility = np.mean(utilities) * 100
-        total_utility = sum(utilities)
+        job_utilities = utilities[(name, 'hard')]
+        avg_utility = np.mean(job_utilities) * 100
+        total_utility = job_utilities.sum()
         
         ax.bar(name, avg_utility, color=color, edgecolor='black', linewidth=1.5, alpha=0.8)
         ax.text(name, avg_utility + 2, f'{avg_utility:.1f}%\n({int(total_utility)} jobs)', 
                ha='center', va='bottom', fontsize=9, fontweight='bold')
     
-    ax.set_title('Hard Real-Time Utility (Binary)', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Average Utility (%)', fontsize=10)
-    ax.set_ylim(0, 105)
-    ax.grid(axis='y', alpha=0.3)
-    ax.axhline(y=100, color='green', linestyle='--', alpha=0.5, label='Max Utility')
+    _style_utility_axis(ax, 'Hard Real-Time Utility (Binary)', max_label='Max Utility')
     
     # 2. Soft Real-Time Utility
     ax = axes[0, 1]
     for name, results, color in algorithms:
-        utilities = [calculate_utility(job, 'soft') for job in results['completed_jobs']]
-        avg_utility = np.mean(utilities) * 100
+        job_utilities = utilities[(name, 'soft')]
+        avg_utility = np.mean(job_utilities) * 100
         
         ax.bar(name, avg_utility, color=color, edgecolor='black', linewidth=1.5, alpha=0.8)
         ax.text(name, avg_utility + 2, f'{avg_utility:.1f}%', 
                ha='center', va='bottom', fontsize=9, fontweight='bold')
     
-    ax.set_title('Soft Real-Time Utility (Exponential Decay)', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Average Utility (%)', fontsize=10)
-    ax.set_ylim(0, 105)
-    ax.grid(axis='y', alpha=0.3)
-    ax.axhline(y=100, color='green', linestyle='--', alpha=0.5, label='Max Utility')
+    _style_utility_axis(ax, 'Soft Real-Time Utility (Exponential Decay)', max_label='Max Utility')
     
     # 3. Firm Real-Time Utility
     ax = axes[1, 0]
     for name, results, color in algorithms:
-        utilities = [calculate_utility(job, 'firm') for job in results['completed_jobs']]
-        avg_utility = np.mean(utilities) * 100
+        job_utilities = utilities[(name, 'firm')]
+        avg_utility = np.mean(job_utilities) * 100
         
         ax.bar(name, avg_utility, color=color, edgecolor='black', linewidth=1.5, alpha=0.8)
         ax.text(name, avg_utility + 2, f'{avg_utility:.1f}%', 
                ha='center', va='bottom', fontsize=9, fontweight='bold')
     
-    ax.set_title('Firm Real-Time Utility (Linear Degradation)', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Average Utility (%)', fontsize=10)
-    ax.set_ylim(0, 105)
-    ax.grid(axis='y', alpha=0.3)
-    ax.axhline(y=100, color='green', linestyle='--', alpha=0.5, label='Max Utility')
+    _style_utility_axis(ax, 'Firm Real-Time Utility (Linear Degradation)', max_label='Max Utility')
     
     # 4. Utility Function Models (Theoretical curves)
     ax = axes[1, 1]
-    time_range = np.linspace(-50, 150, 300)  # Time relative to deadline
-    deadline_point = 0
-    
-    # Hard real-time
-    hard_utility = np.where(time_range <= deadline_point, 1.0, 0.0)
-    ax.plot(time_range, hard_utility, 'r-', linewidth=2.5, label='Hard RT', alpha=0.8)
-    
-    # Soft real-time
-    soft_utility = np.where(time_range <= deadline_point, 
-                           1.0, 
-                           np.exp(-time_range / 50))
-    ax.plot(time_range, soft_utility, 'b-', linewidth=2.5, label='Soft RT', alpha=0.8)
-    
-    # Firm real-time
-    firm_utility = np.where(time_range <= deadline_point, 
-                           0.7 + 0.3 * (1 - time_range / (-50)),
-                           0.0)
-    firm_utility = np.clip(firm_utility, 0, 1)
-    ax.plot(time_range, firm_utility, 'g-', linewidth=2.5, label='Firm RT', alpha=0.8)
+    time_range = _THEO_TIME
+    ax.plot(time_range, _THEO_HARD, 'r-', linewidth=2.5, label='Hard RT', alpha=0.8)
+    ax.plot(time_range, _THEO_SOFT, 'b-', linewidth=2.5, label='Soft RT', alpha=0.8)
+    ax.plot(time_range, _THEO_FIRM, 'g-', linewidth=2.5, label='Firm RT', alpha=0.8)
     
     ax.axvline(x=0, color='black', linestyle='--', linewidth=2, label='Deadline')
     ax.set_title('Utility Function Models', fontsize=12, fontweight='bold')
@@ -952,17 +1030,16 @@ def visualize_utility_curves(results_edf, results_rm, results_fifo):
     ax.fill_between(time_range, 0, 1.1, where=(time_range > 0), 
                     color='red', alpha=0.1, label='After Deadline')
     
-    plt.tight_layout()
-    plt.savefig('utility_curves.png', dpi=300, bbox_inches='tight')
+    save_png('utility_curves.png', dpi=300)
     print(f"Saved utility_curves.png")
 
-def visualize_cumulative_utility(results_edf, results_rm, results_fifo):
+def visualize_cumulative_utility(results_edf, results_rm, results_fifo, utilities=None):
     """Visualize cumulative utility over time"""
-    fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+    if utilities is None:
+        utilities = compute_utility_table(results_edf, results_rm, results_fifo)
+    fig, axes = pooled_subplots(1, 3, figsize=(16, 5))
     
-    algorithms = [('EDF', results_edf, '#FF6B6B'), 
-                  ('RM', results_rm, '#4ECDC4'), 
-                  ('FIFO', results_fifo, '#45B7D1')]
+    algorithms = list(zip(('EDF', 'RM', 'FIFO'), (results_edf, results_rm, results_fifo), ALGORITHM_COLORS))
     
     utility_types = [('Hard RT', 'hard'), ('Soft RT', 'soft'), ('Firm RT', 'firm')]
     
@@ -970,21 +1047,13 @@ def visualize_cumulative_utility(results_edf, results_rm, results_fifo):
         ax = axes[idx]
         
         for name, results, color in algorithms:
-            # Sort jobs by finish time
-            sorted_jobs = sorted([j for j in results['completed_jobs'] if j.finish_time], 
-                                key=lambda x: x.finish_time)
-            
-            times = []
-            cumulative_utility = []
-            total_util = 0
-            
-            for job in sorted_jobs:
-                utility = calculate_utility(job, util_type)
-                total_util += utility
-                times.append(job.finish_time)
-                cumulative_utility.append(total_util)
+            # Sort jobs by finish time and accumulate
+            finish = results['jobs']['finish']
+            order = np.argsort(finish, kind='stable')
+            times = finish[order]
+            cumulative_utility = np.cumsum(utilities[(name, util_type)][order])
             
-            if times:
+            if times.size:
                 ax.plot(times, cumulative_utility, linewidth=2.5, label=name, color=color, alpha=0.8)
         
         ax.set_title(f'Cumulative Utility Over Time ({util_name})', fontsize=12, fontweight='bold')
@@ -994,65 +1063,75 @@ def visualize_cumulative_utility(results_edf, results_rm, results_fifo):
         ax.grid(True, alpha=0.3)
         ax.set_xlim(0, 10000)  # First 10 seconds
     
-    plt.tight_layout()
-    plt.savefig('cumulative_utility.png', dpi=300, bbox_inches='tight')
+    save_png('cumulative_utility.png', dpi=300)
     print(f"Saved cumulative_utility.png")
 
-def visualize_per_task_utility(results_edf, results_rm, results_fifo):
+def visualize_per_task_utility(results_edf, results_rm, results_fifo, utilities=None):
     """Visualize utility per task for each algorithm"""
-    fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+    fig, axes = pooled_subplots(1, 3, figsize=(16, 5))
     
     tasks = ['Ultra', 'Sound', 'PIR', 'Button']
     algorithms = [('EDF', results_edf), ('RM', results_rm), ('FIFO', results_fifo)]
     colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
     
     utility_type = 'soft'  # Using soft real-time model
+    if utilities is None:
+        utilities = compute_utility_table(results_edf, results_rm, results_fifo, (utility_type,))
     
     for idx, (name, results) in enumerate(algorithms):
         ax = axes[idx]
         
+        job_utilities = utilities[(name, utility_type)]
+        task_ids = {task_name: i for i, task_name in enumerate(results['task_names'])}
+        
         task_utilities = []
         for task in tasks:
-            task_jobs = [job for job in results['completed_jobs'] if job.task.name == task]
-            utilities = [calculate_utility(job, utility_type) for job in task_jobs]
-            avg_utility = np.mean(utilities) * 100 if utilities else 0
+            task_utils = job_utilities[results['jobs']['task_id'] == task_ids.get(task, IDLE_ID)]
+            avg_utility = np.mean(task_utils) * 100 if task_utils.size else 0
             task_utilities.append(avg_utility)
         
         bars = ax.bar(tasks, task_utilities, color=colors, edgecolor='black', linewidth=1.5, alpha=0.8)
         
         # Add value labels on bars
-        for bar, value in zip(bars, task_utilities):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                   f'{value:.1f}%', ha='center', va='bottom', fontsize=9, fontweight='bold')
+        ax.bar_label(bars, labels=[f'{v:.1f}%' for v in task_utilities], padding=3, fontsize=9, fontweight='bold')
         
-        ax.set_title(f'{name} - Utility by Task (Soft RT)', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Average Utility (%)', fontsize=10)
-        ax.set_ylim(0, 105)
-        ax.grid(axis='y', alpha=0.3)
-        ax.axhline(y=100, color='green', linestyle='--', alpha=0.5)
+        _style_utility_axis(ax, f'{name} - Utility by Task (Soft RT)')
     
-    plt.tight_layout()
-    plt.savefig('per_task_utility.png', dpi=300, bbox_inches='tight')
+    save_png('per_task_utility.png', dpi=300)
     print(f"Saved per_task_utility.png")
 
+def _latency_by_traffic_class(results):
+    """Split the non-zero job latencies into all, delay-sensitive and delay-tolerant arrays"""
+    latency = results['jobs']['response']
+    has_latency = latency != 0
+    sensitive, tolerant = _traffic_class_masks(results)
+    return {
+        'all': latency[has_latency],
+        'sensitive': latency[has_latency & sensitive],
+        'tolerant': latency[has_latency & tolerant]
+    }
+
 def visualize_latency_analysis(results_edf, results_rm, results_fifo):
     """Visualize latency (response time) distribution and impact - M2M style"""
-    fig = plt.figure(figsize=(18, 11))
+    fig = pooled_figure((18, 11))
     gs = fig.add_gridspec(3, 3, hspace=0.35, wspace=0.35)
     
     algorithms = [('EDF', results_edf, '#FF6B6B'), 
                   ('RM', results_rm, '#4ECDC4'), 
                   ('FIFO', results_fifo, '#45B7D1')]
     
+    # One pass over each algorithm's jobs for every panel below
+    latency = {name: _latency_by_traffic_class(results) for name, results, _ in algorithms}
+    
     # 1. Latency Distribution Histograms (Top row) - IMPROVED
     for idx, (name, results, color) in enumerate(algorithms):
         ax = fig.add_subplot(gs[0, idx])
-        latencies = [job.response_time for job in results['completed_jobs'] if job.response_time]
+        latencies = latency[name]['all']
         
         # Create histogram with better bins
-        n, bins, patches = ax.hist(latencies, bins=25, color=color, edgecolor='black', 
-                                   alpha=0.7, linewidth=1)
+        counts, edges = np.histogram(latencies, bins=25)
+        ax.stairs(counts, edges, fill=True, facecolor=color, edgecolor='black', 
+                  alpha=0.7, linewidth=1)
         
         # Add mean line
         mean_lat = results['avg_response_time']
@@ -1064,41 +1143,29 @@ def visualize_latency_analysis(results_edf, results_rm, results_fifo):
         ax.set_ylabel('Frequency', fontsize=10)
         ax.legend(fontsize=9, loc='upper right')
         ax.grid(axis='y', alpha=0.3, linestyle='--')
-        ax.set_xlim(0, max(latencies) * 1.1 if latencies else 100)
+        ax.set_xlim(0, latencies.max() * 1.1 if latencies.size else 100)
     
     # 2. Traffic Class Box Plot (Row 2, spanning all columns) - CLEANED UP
     ax1 = fig.add_subplot(gs[1, :])
     
-    delay_sensitive_tasks = ['PIR', 'Button', 'Ultra']
-    delay_tolerant_tasks = ['Sound']
-    
-    data_to_plot = []
-    positions = []
-    labels = []
-    colors_box = []
-    
-    pos = 1
-    for name, results, color in algorithms:
-        # Delay-sensitive latencies
-        sens_latencies = [job.response_time for job in results['completed_jobs'] 
-                         if job.task.name in delay_sensitive_tasks and job.response_time]
-        # Delay-tolerant latencies  
-        tol_latencies = [job.response_time for job in results['completed_jobs'] 
-                        if job.task.name in delay_tolerant_tasks and job.response_time]
-        
-        data_to_plot.extend([sens_latencies, tol_latencies])
-        positions.extend([pos, pos + 0.8])
-        labels.extend([f'{name}\nDelay-Sensitive', f'{name}\nDelay-Tolerant'])
-        colors_box.extend([color, color])
-        pos += 2.5
-    
-    bp = ax1.boxplot(data_to_plot, positions=positions, widths=0.6, patch_artist=True,
-                     showmeans=True, meanprops=dict(marker='^', markerfacecolor='green', 
-                                                     markersize=8, markeredgecolor='black'),
-                     medianprops=dict(color='black', linewidth=2),
-                     boxprops=dict(linewidth=1.5),
-                     whiskerprops=dict(linewidth=1.5),
-                     capprops=dict(linewidth=1.5))
+    # Two boxes (sensitive, tolerant) per algorithm, each pair 2.5 apart
+    classes = (('sensitive', 'Delay-Sensitive'), ('tolerant', 'Delay-Tolerant'))
+    data_to_plot = [latency[name][key] for name, _, _ in algorithms for key, _ in classes]
+    labels = [f'{name}\n{label}' for name, _, _ in algorithms for _, label in classes]
+    colors_box = [color for _, _, color in algorithms for _ in classes]
+    positions = np.empty(len(data_to_plot))
+    positions[::2] = 1 + 2.5 * np.arange(len(algorithms))
+    positions[1::2] = positions[::2] + 0.8
+    
+    # Compute the quartile/whisker statistics up front and draw them with bxp
+    box_stats = boxplot_stats(data_to_plot, whis=1.5)
+    bp = ax1.bxp(box_stats, positions=positions, widths=0.6, patch_artist=True,
+                 showmeans=True, meanprops=dict(marker='^', markerfacecolor='green', 
+                                                 markersize=8, markeredgecolor='black'),
+                 medianprops=dict(color='black', linewidth=2),
+                 boxprops=dict(linewidth=1.5),
+                 whiskerprops=dict(linewidth=1.5),
+                 capprops=dict(linewidth=1.5))
     
     for patch, color in zip(bp['boxes'], colors_box):
         patch.set_facecolor(color)
@@ -1117,7 +1184,7 @@ def visualize_latency_analysis(results_edf, results_rm, results_fifo):
     
     # 3. Utility Curves (Bottom left two) - ENHANCED
     ax2 = fig.add_subplot(gs[2, 0])
-    latency_range = np.linspace(0, 150, 500)
+    latency_range = np.linspace(0, 150, 151)  # 1 ms steps, so the 70 and 100 ms thresholds are samples
     
     # Delay-sensitive curve (step function)
     threshold = 70
@@ -1164,17 +1231,10 @@ def visualize_latency_analysis(results_edf, results_rm, results_fifo):
     x_pos = np.arange(len(algorithms))
     width = 0.35
     
-    sens_avgs = []
-    tol_avgs = []
-    
-    for name, results, color in algorithms:
-        sens_latencies = [job.response_time for job in results['completed_jobs'] 
-                         if job.task.name in delay_sensitive_tasks and job.response_time]
-        tol_latencies = [job.response_time for job in results['completed_jobs'] 
-                        if job.task.name in delay_tolerant_tasks and job.response_time]
-        
-        sens_avgs.append(np.mean(sens_latencies) if sens_latencies else 0)
-        tol_avgs.append(np.mean(tol_latencies) if tol_latencies else 0)
+    # Averages come from the same per-class latency arrays as the box plot above
+    sens_avgs, tol_avgs = ([np.mean(latency[name][key]) if latency[name][key].size else 0
+                            for name, _, _ in algorithms]
+                           for key in ('sensitive', 'tolerant'))
     
     bars1 = ax4.bar(x_pos - width/2, sens_avgs, width, label='Delay-Sensitive', 
             color='#FF6B6B', edgecolor='black', alpha=0.8, linewidth=1.5)
@@ -1182,15 +1242,8 @@ def visualize_latency_analysis(results_edf, results_rm, results_fifo):
             color='#4ECDC4', edgecolor='black', alpha=0.8, linewidth=1.5)
     
     # Add value labels on bars
-    for bar in bars1:
-        height = bar.get_height()
-        ax4.text(bar.get_x() + bar.get_width()/2., height + max(sens_avgs)*0.02,
-                f'{height:.1f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
-    
-    for bar in bars2:
-        height = bar.get_height()
-        ax4.text(bar.get_x() + bar.get_width()/2., height + max(tol_avgs)*0.02,
-                f'{height:.1f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
+    for bars, values in ((bars1, sens_avgs), (bars2, tol_avgs)):
+        ax4.bar_label(bars, labels=[f'{v:.1f}' for v in values], padding=3, fontsize=9, fontweight='bold')
     
     ax4.set_title('Avg Latency by Traffic Class', fontsize=11, fontweight='bold')
     ax4.set_ylabel('Average Latency (ms)', fontsize=10, fontweight='bold')
@@ -1201,7 +1254,8 @@ def visualize_latency_analysis(results_edf, results_rm, results_fifo):
     ax4.grid(axis='y', alpha=0.3, linestyle='--')
     
     plt.suptitle('Latency Analysis - M2M Traffic Classification', fontsize=15, fontweight='bold', y=0.995)
-    plt.savefig('latency_analysis_m2m.png', dpi=300, bbox_inches='tight')
+    # Laid out by the gridspec spacing rather than tight_layout, so crop with the tight bbox
+    save_png('latency_analysis_m2m.png', dpi=300, bbox_inches='tight')
     print(f"Saved latency_analysis_m2m.png")
 
 def print_latency_summary(results_edf, results_rm, results_fifo):
@@ -1210,84 +1264,93 @@ def print_latency_summary(results_edf, results_rm, results_fifo):
     print("LATENCY ANALYSIS - M2M TRAFFIC CLASSIFICATION")
     print("="*80)
     
-    delay_sensitive_tasks = ['PIR', 'Button', 'Ultra']
-    delay_tolerant_tasks = ['Sound']
-    
     algorithms = [('EDF', results_edf), ('RM', results_rm), ('FIFO', results_fifo)]
     
     for name, results in algorithms:
         print(f"\n{name} Scheduler:")
         print("-" * 40)
         
+        jobs = results['jobs']
+        sens_mask, tol_mask = _traffic_class_masks(results)
+        latency = _latency_by_traffic_class(results)
+        
         # Delay-sensitive analysis
-        sens_jobs = [job for job in results['completed_jobs'] 
-                    if job.task.name in delay_sensitive_tasks]
-        sens_latencies = [job.response_time for job in sens_jobs if job.response_time]
-        sens_missed = sum(1 for job in sens_jobs if job.missed_deadline)
+        sens_jobs = np.count_nonzero(sens_mask)
+        sens_latencies = latency['sensitive']
+        sens_missed = np.count_nonzero(jobs['missed'] & sens_mask)
         
-        if sens_latencies:
+        if sens_latencies.size:
             print(f"  Delay-Sensitive Tasks (PIR, Button, Ultra):")
             print(f"    Average Latency: {np.mean(sens_latencies):.2f} ms")
             print(f"    Max Latency: {np.max(sens_latencies):.2f} ms")
             print(f"    Min Latency: {np.min(sens_latencies):.2f} ms")
-            print(f"    Missed Deadlines: {sens_missed}/{len(sens_jobs)}")
-            print(f"    Success Rate: {((len(sens_jobs)-sens_missed)/len(sens_jobs)*100):.1f}%")
+            print(f"    Missed Deadlines: {sens_missed}/{sens_jobs}")
+            print(f"    Success Rate: {((sens_jobs-sens_missed)/sens_jobs*100):.1f}%")
         
         # Delay-tolerant analysis
-        tol_jobs = [job for job in results['completed_jobs'] 
-                   if job.task.name in delay_tolerant_tasks]
-        tol_latencies = [job.response_time for job in tol_jobs if job.response_time]
-        tol_missed = sum(1 for job in tol_jobs if job.missed_deadline)
+        tol_jobs = np.count_nonzero(tol_mask)
+        tol_latencies = latency['tolerant']
+        tol_missed = np.count_nonzero(jobs['missed'] & tol_mask)
         
-        if tol_latencies:
+        if tol_latencies.size:
             print(f"  Delay-Tolerant Tasks (Sound):")
             print(f"    Average Latency: {np.mean(tol_latencies):.2f} ms")
             print(f"    Max Latency: {np.max(tol_latencies):.2f} ms")
             print(f"    Min Latency: {np.min(tol_latencies):.2f} ms")
-            print(f"    Missed Deadlines: {tol_missed}/{len(tol_jobs)}")
-            print(f"    Success Rate: {((len(tol_jobs)-tol_missed)/len(tol_jobs)*100):.1f}%")
+            print(f"    Missed Deadlines: {tol_missed}/{tol_jobs}")
+            print(f"    Success Rate: {((tol_jobs-tol_missed)/tol_jobs*100):.1f}%")
     
     print("\n" + "="*80)
 
 def visualize_deadline_miss_timeline(results_edf, results_rm, results_fifo):
     """Show when deadline misses occur over time"""
-    fig, axes = plt.subplots(3, 1, figsize=(16, 10), sharex=True)
+    fig, axes = pooled_subplots(3, 1, figsize=(16, 10), sharex=True)
     
     algorithms = [('EDF', results_edf, '#FF6B6B'), 
                   ('RM', results_rm, '#4ECDC4'), 
                   ('FIFO', results_fifo, '#45B7D1')]
     
-    task_names = ['Ultra', 'PIR', 'Button', 'Sound']
+    task_names = list(TASK_ROW)
     task_colors = {'Ultra': '#FF6B6B', 'PIR': '#45B7D1', 'Button': '#FFA07A', 'Sound': '#4ECDC4'}
+    time_window = 10000  # First 10 seconds
     
     for idx, (name, results, color) in enumerate(algorithms):
         ax = axes[idx]
         
         # Get missed deadline events
-        missed_jobs = [job for job in results['completed_jobs'] if job.missed_deadline]
+        jobs = results['jobs']
+        missed = jobs['missed']
+        num_missed = np.count_nonzero(missed)
         
-        if missed_jobs:
-            times = [job.finish_time for job in missed_jobs]
-            tasks = [job.task.name for job in missed_jobs]
+        if num_missed:
+            missed_finish = jobs['finish'][missed]
+            missed_task_ids = jobs['task_id'][missed]
+            task_y = np.array([TASK_ROW[task] for task in results['task_names']])
+            task_color = np.array([task_colors[task] for task in results['task_names']])
+            
+            # Plot the misses inside the time window as one scatter, colored per task
+            shown = missed_finish < time_window
+            shown_task_ids = missed_task_ids[shown]
+            ax.scatter(missed_finish[shown], task_y[shown_task_ids], c=task_color[shown_task_ids], 
+                       s=100, marker='X', edgecolors='black', linewidth=1.5, alpha=0.8, rasterized=True)
             
-            # Plot missed deadlines as scatter
-            for task in task_names:
-                task_times = [t for t, tn in zip(times, tasks) if tn == task]
-                task_y = [task_names.index(task)] * len(task_times)
-                if task_times:
-                    ax.scatter(task_times, task_y, c=task_colors[task], s=100, 
-                             marker='X', edgecolors='black', linewidth=1.5, 
-                             label=f'{task} ({len(task_times)} misses)', alpha=0.8)
+            # One legend entry per task that missed any deadline
+            misses_per_task = np.bincount(missed_task_ids, minlength=len(results['task_names']))
+            task_ids = {task: idx for idx, task in enumerate(results['task_names'])}
+            legend_elements = [plt.Line2D([0], [0], marker='X', color='w', markerfacecolor=task_colors[task], 
+                                          markersize=10, markeredgecolor='black', markeredgewidth=1.5, alpha=0.8, 
+                                          label=f'{task} ({misses_per_task[task_ids[task]]} misses)', linestyle='None')
+                               for task in task_names if misses_per_task[task_ids[task]]]
         
         ax.set_ylabel(f'{name}', fontsize=11, fontweight='bold')
         ax.set_yticks(range(len(task_names)))
         ax.set_yticklabels(task_names)
         ax.grid(True, alpha=0.3)
-        ax.set_xlim(0, 10000)  # First 10 seconds
+        ax.set_xlim(0, time_window)
         
-        if missed_jobs:
-            ax.legend(loc='upper right', fontsize=9)
-            ax.set_title(f'{name}: {len(missed_jobs)} Total Deadline Misses', 
+        if num_missed:
+            ax.legend(handles=legend_elements, loc='upper right', fontsize=9)
+            ax.set_title(f'{name}: {num_missed} Total Deadline Misses', 
                         fontsize=11, fontweight='bold')
         else:
             ax.set_title(f'{name}: No Deadline Misses ✓', 
@@ -1296,63 +1359,69 @@ def visualize_deadline_miss_timeline(results_edf, results_rm, results_fifo):
     axes[2].set_xlabel('Time (ms)', fontsize=11, fontweight='bold')
     fig.suptitle('Deadline Miss Timeline (First 10 seconds)', fontsize=14, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig('deadline_miss_timeline.png', dpi=300, bbox_inches='tight')
+    save_png('deadline_miss_timeline.png', dpi=300)
     print(f"Saved deadline_miss_timeline.png")
 
+def _binned_latency(results, time_window, bin_size):
+    """Average latency per (task row, time bin) over the first time_window ms, as float32"""
+    num_tasks = len(TASK_ROW)
+    num_bins = time_window // bin_size
+    
+    # Accumulate each job into its flattened cell
+    jobs = results['jobs']
+    task_rows = np.array([TASK_ROW[task] for task in results['task_names']])
+    in_window = (jobs['finish'] < time_window) & (jobs['response'] != 0)
+    cells = task_rows[jobs['task_id'][in_window]] * num_bins + jobs['finish'][in_window] // bin_size
+    num_cells = num_tasks * num_bins
+    latency_matrix = np.bincount(cells, weights=jobs['response'][in_window], 
+                                 minlength=num_cells).reshape(num_tasks, num_bins)
+    count_matrix = np.bincount(cells, minlength=num_cells).reshape(num_tasks, num_bins)
+    
+    # Average into a float32 matrix, leaving empty bins at 0
+    avg_latency = np.zeros((num_tasks, num_bins), dtype=np.float32)
+    np.divide(latency_matrix, count_matrix, out=avg_latency, where=count_matrix > 0, casting='same_kind')
+    return avg_latency
+
 def visualize_latency_heatmap(results_edf, results_rm, results_fifo):
     """Create a heatmap showing latency patterns over time"""
-    fig, axes = plt.subplots(1, 3, figsize=(18, 5))
+    fig, axes = pooled_subplots(1, 3, figsize=(18, 5))
     
     algorithms = [('EDF', results_edf), ('RM', results_rm), ('FIFO', results_fifo)]
-    tasks = ['Ultra', 'PIR', 'Button', 'Sound']
+    tasks = list(TASK_ROW)
     
     time_window = 10000  # First 10 seconds
     bin_size = 500  # 500ms bins
-    num_bins = time_window // bin_size
+    bin_start_formatter = FuncFormatter(lambda x, _: f'{int(x) * bin_size}')
     
-    for idx, (name, results) in enumerate(algorithms):
-        ax = axes[idx]
-        
-        # Create matrix: tasks x time_bins
-        latency_matrix = np.zeros((len(tasks), num_bins))
-        count_matrix = np.zeros((len(tasks), num_bins))
-        
-        for job in results['completed_jobs']:
-            if job.finish_time < time_window and job.response_time:
-                task_idx = tasks.index(job.task.name)
-                time_bin = int(job.finish_time // bin_size)
-                if time_bin < num_bins:
-                    latency_matrix[task_idx, time_bin] += job.response_time
-                    count_matrix[task_idx, time_bin] += 1
-        
-        # Calculate average latency per bin
-        with np.errstate(divide='ignore', invalid='ignore'):
-            avg_latency = np.where(count_matrix > 0, latency_matrix / count_matrix, 0)
-        
+    # Bin every algorithm first so all three heatmaps share one color scale
+    avg_latencies = [_binned_latency(results, time_window, bin_size) for _, results in algorithms]
+    norm = Normalize(vmin=0, vmax=max(float(avg_latency.max()) for avg_latency in avg_latencies))
+    
+    for ax, (name, _), avg_latency in zip(axes, algorithms, avg_latencies):
         # Plot heatmap
-        im = ax.imshow(avg_latency, aspect='auto', cmap='RdYlGn_r', interpolation='nearest')
+        im = ax.imshow(avg_latency, aspect='auto', cmap='RdYlGn_r', norm=norm, interpolation='nearest', 
+                       rasterized=True)
         ax.set_yticks(range(len(tasks)))
         ax.set_yticklabels(tasks)
         ax.set_xlabel('Time Window (500ms bins)', fontsize=10)
         ax.set_title(f'{name} Latency Heatmap', fontsize=12, fontweight='bold')
         
-        # Add colorbar
-        cbar = plt.colorbar(im, ax=ax)
-        cbar.set_label('Avg Latency (ms)', fontsize=9)
-        
-        # Add grid
-        ax.set_xticks(np.arange(num_bins))
-        ax.set_xticklabels([f'{i*bin_size}' for i in range(num_bins)], rotation=45, fontsize=8)
+        # Label a handful of bins by their start time instead of every bin
+        ax.xaxis.set_major_locator(MaxNLocator(8, integer=True))
+        ax.xaxis.set_major_formatter(bin_start_formatter)
+        ax.tick_params(axis='x', labelrotation=45, labelsize=8)
         ax.grid(False)
     
-    plt.tight_layout()
-    plt.savefig('latency_heatmap.png', dpi=300, bbox_inches='tight')
+    # One colorbar for the shared scale
+    cbar = fig.colorbar(im, ax=list(axes), shrink=0.8)
+    cbar.set_label('Avg Latency (ms)', fontsize=9)
+    
+    save_png('latency_heatmap.png', dpi=300)
     print(f"Saved latency_heatmap.png")
 
 def visualize_schedulability_analysis(results_edf, results_rm, results_fifo):
     """Show schedulability metrics and CPU load analysis"""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig, axes = pooled_subplots(2, 2, figsize=(14, 10))
     
     algorithms = [('EDF', results_edf, '#FF6B6B'), 
                   ('RM', results_rm, '#4ECDC4'), 
@@ -1360,17 +1429,18 @@ def visualize_schedulability_analysis(results_edf, results_rm, results_fifo):
     
     # 1. Success Rate by Task
     ax = axes[0, 0]
-    tasks = ['Ultra', 'PIR', 'Button', 'Sound']
+    tasks = list(TASK_ROW)
     x = np.arange(len(tasks))
     width = 0.25
     
     for i, (name, results, color) in enumerate(algorithms):
-        success_rates = []
-        for task in tasks:
-            task_jobs = [job for job in results['completed_jobs'] if job.task.name == task]
-            missed = sum(1 for job in task_jobs if job.missed_deadline)
-            success_rate = ((len(task_jobs) - missed) / len(task_jobs) * 100) if task_jobs else 0
-            success_rates.append(success_rate)
+        # Per-task job and miss counts in one bincount each, on the plot's task order
+        jobs = results['jobs']
+        task_rows = np.array([TASK_ROW[task] for task in results['task_names']])[jobs['task_id']]
+        task_jobs = np.bincount(task_rows, minlength=len(tasks))
+        missed = np.bincount(task_rows, weights=jobs['missed'], minlength=len(tasks))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            success_rates = np.where(task_jobs > 0, (task_jobs - missed) / task_jobs * 100, 0)
         
         ax.bar(x + i*width, success_rates, width, label=name, color=color, 
                edgecolor='black', alpha=0.8)
@@ -1388,24 +1458,17 @@ def visualize_schedulability_analysis(results_edf, results_rm, results_fifo):
     ax = axes[0, 1]
     fifo_avg = results_fifo['avg_response_time']
     
-    latency_reduction = []
-    algo_names = []
-    colors_bar = []
-    
-    for name, results, color in algorithms:
-        if name != 'FIFO':
-            reduction = ((fifo_avg - results['avg_response_time']) / fifo_avg) * 100
-            latency_reduction.append(reduction)
-            algo_names.append(name)
-            colors_bar.append(color)
+    # Every algorithm except the FIFO baseline itself
+    compared = [(name, results, color) for name, results, color in algorithms if name != 'FIFO']
+    algo_names = [name for name, _, _ in compared]
+    colors_bar = [color for _, _, color in compared]
+    avgs = np.array([results['avg_response_time'] for _, results, _ in compared])
+    latency_reduction = ((fifo_avg - avgs) / fifo_avg * 100).tolist()
     
     bars = ax.bar(algo_names, latency_reduction, color=colors_bar, 
                   edgecolor='black', linewidth=1.5, alpha=0.8)
     
-    for bar, value in zip(bars, latency_reduction):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-               f'{value:.1f}%', ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{v:.1f}%' for v in latency_reduction], padding=3, fontsize=10, fontweight='bold')
     
     ax.set_ylabel('Latency Reduction (%)', fontsize=10, fontweight='bold')
     ax.set_title('Latency Reduction vs FIFO Baseline', fontsize=12, fontweight='bold')
@@ -1419,19 +1482,14 @@ def visualize_schedulability_analysis(results_edf, results_rm, results_fifo):
     colors_all = []
     
     for name, results, color in algorithms:
-        response_times = [job.response_time for job in results['completed_jobs'] if job.response_time]
-        jitter = np.std(response_times) if response_times else 0
-        jitters.append(jitter)
+        jitters.append(results['response_jitter'])
         algo_names_all.append(name)
         colors_all.append(color)
     
     bars = ax.bar(algo_names_all, jitters, color=colors_all, 
                   edgecolor='black', linewidth=1.5, alpha=0.8)
     
-    for bar, value in zip(bars, jitters):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-               f'{value:.1f}ms', ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{v:.1f}ms' for v in jitters], padding=3, fontsize=10, fontweight='bold')
     
     ax.set_ylabel('Jitter (Std Dev of Latency, ms)', fontsize=10, fontweight='bold')
     ax.set_title('Latency Jitter (Lower is Better)', fontsize=12, fontweight='bold')
@@ -1446,7 +1504,7 @@ def visualize_schedulability_analysis(results_edf, results_rm, results_fifo):
         # Normalize metrics (0-100 scale, lower is better)
         miss_score = (results['missed_deadlines'] / results['total_jobs']) * 100 if results['total_jobs'] > 0 else 0
         latency_score = (results['avg_response_time'] / 300) * 100  # Normalize by 300ms
-        jitter_score = (np.std([job.response_time for job in results['completed_jobs'] if job.response_time]) / 100) * 100
+        jitter_score = (results['response_jitter'] / 100) * 100
         
         # Weighted composite (lower is better)
         composite = (miss_score * 0.5) + (latency_score * 0.3) + (jitter_score * 0.2)
@@ -1458,42 +1516,44 @@ def visualize_schedulability_analysis(results_edf, results_rm, results_fifo):
     bars = ax.bar(algo_names_all, performance_scores, color=colors_all, 
                   edgecolor='black', linewidth=1.5, alpha=0.8)
     
-    for bar, value in zip(bars, performance_scores):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-               f'{value:.1f}', ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{v:.1f}' for v in performance_scores], padding=3, fontsize=10, fontweight='bold')
     
     ax.set_ylabel('Performance Score (Higher is Better)', fontsize=10, fontweight='bold')
     ax.set_title('Overall Performance Score', fontsize=12, fontweight='bold')
     ax.set_ylim(0, 105)
     ax.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('schedulability_analysis.png', dpi=300, bbox_inches='tight')
+    save_png('schedulability_analysis.png', dpi=300)
     print(f"Saved schedulability_analysis.png")
 
+def _qos_metrics(results):
+    """Algorithm-level QoS aggregates shared by the bar panels and the radar chart"""
+    total_jobs = results['total_jobs']
+    return {
+        'throughput': total_jobs / 30,  # jobs per second (30 second simulation)
+        'reliability': ((total_jobs - results['missed_deadlines']) / total_jobs * 100) if total_jobs > 0 else 0,
+        'cv': results['response_cv'],  # Coefficient of variation
+        'lat_score': 100 - min(100, (results['avg_response_time'] / 300) * 100)  # Lower is better, invert
+    }
+
 def visualize_qos_metrics(results_edf, results_rm, results_fifo):
     """Quality of Service metrics visualization"""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    # The polar radar panel is laid out with tight_layout below
+    fig, axes = pooled_subplots(2, 2, figsize=(14, 10), layout=None)
     
     algorithms = [('EDF', results_edf, '#FF6B6B'), 
                   ('RM', results_rm, '#4ECDC4'), 
                   ('FIFO', results_fifo, '#45B7D1')]
+    qos = {name: _qos_metrics(results) for name, results, _ in algorithms}
     
     # 1. Throughput (jobs completed per second)
     ax = axes[0, 0]
-    throughputs = []
-    for name, results, color in algorithms:
-        throughput = (results['total_jobs'] / 30)  # jobs per second (30 second simulation)
-        throughputs.append(throughput)
+    throughputs = [qos[name]['throughput'] for name, _, _ in algorithms]
     
     bars = ax.bar([n for n, _, _ in algorithms], throughputs, 
                   color=[c for _, _, c in algorithms], edgecolor='black', alpha=0.8)
     
-    for bar, value in zip(bars, throughputs):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-               f'{value:.1f}', ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{v:.1f}' for v in throughputs], padding=3, fontsize=10, fontweight='bold')
     
     ax.set_ylabel('Throughput (jobs/sec)', fontsize=10, fontweight='bold')
     ax.set_title('System Throughput', fontsize=12, fontweight='bold')
@@ -1501,18 +1561,12 @@ def visualize_qos_metrics(results_edf, results_rm, results_fifo):
     
     # 2. Reliability (percentage of jobs meeting deadlines)
     ax = axes[0, 1]
-    reliability = []
-    for name, results, color in algorithms:
-        rel = ((results['total_jobs'] - results['missed_deadlines']) / results['total_jobs'] * 100) if results['total_jobs'] > 0 else 0
-        reliability.append(rel)
+    reliability = [qos[name]['reliability'] for name, _, _ in algorithms]
     
     bars = ax.bar([n for n, _, _ in algorithms], reliability, 
                   color=[c for _, _, c in algorithms], edgecolor='black', alpha=0.8)
     
-    for bar, value in zip(bars, reliability):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-               f'{value:.1f}%', ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{v:.1f}%' for v in reliability], padding=3, fontsize=10, fontweight='bold')
     
     ax.set_ylabel('Reliability (%)', fontsize=10, fontweight='bold')
     ax.set_title('System Reliability (Deadline Met %)', fontsize=12, fontweight='bold')
@@ -1522,22 +1576,12 @@ def visualize_qos_metrics(results_edf, results_rm, results_fifo):
     
     # 3. Predictability (coefficient of variation)
     ax = axes[1, 0]
-    predictability = []
-    for name, results, color in algorithms:
-        response_times = [job.response_time for job in results['completed_jobs'] if job.response_time]
-        if response_times:
-            cv = (np.std(response_times) / np.mean(response_times)) * 100  # Coefficient of variation
-            predictability.append(cv)
-        else:
-            predictability.append(0)
+    predictability = [qos[name]['cv'] for name, _, _ in algorithms]
     
     bars = ax.bar([n for n, _, _ in algorithms], predictability, 
                   color=[c for _, _, c in algorithms], edgecolor='black', alpha=0.8)
     
-    for bar, value in zip(bars, predictability):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-               f'{value:.1f}%', ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{v:.1f}%' for v in predictability], padding=3, fontsize=10, fontweight='bold')
     
     ax.set_ylabel('Coefficient of Variation (%)', fontsize=10, fontweight='bold')
     ax.set_title('Response Time Predictability (Lower is Better)', fontsize=12, fontweight='bold')
@@ -1556,14 +1600,11 @@ def visualize_qos_metrics(results_edf, results_rm, results_fifo):
     
     for name, results, color in algorithms:
         # Normalize all metrics to 0-100 scale
-        rel = ((results['total_jobs'] - results['missed_deadlines']) / results['total_jobs'] * 100) if results['total_jobs'] > 0 else 0
-        lat = 100 - min(100, (results['avg_response_time'] / 300) * 100)  # Lower is better, invert
-        response_times = [job.response_time for job in results['completed_jobs'] if job.response_time]
-        pred = 100 - min(100, (np.std(response_times) / np.mean(response_times)) * 100) if response_times else 0
-        cpu_eff = results['cpu_utilization']
-        thr = min(100, (results['total_jobs'] / 30) * 5)  # Scale throughput
+        metrics = qos[name]
+        pred = 100 - min(100, metrics['cv']) if results['total_jobs'] else 0
+        thr = min(100, metrics['throughput'] * 5)  # Scale throughput
         
-        values = [rel, lat, pred, cpu_eff, thr]
+        values = [metrics['reliability'], metrics['lat_score'], pred, results['cpu_utilization'], thr]
         values += values[:1]
         
         ax.plot(angles, values, 'o-', linewidth=2, label=name, color=color)
@@ -1577,42 +1618,65 @@ def visualize_qos_metrics(results_edf, results_rm, results_fifo):
     ax.grid(True)
     
     plt.tight_layout()
-    plt.savefig('qos_metrics.png', dpi=300, bbox_inches='tight')
+    # The radar legend is anchored outside the axes, so this one still needs the tight bbox
+    save_png('qos_metrics.png', dpi=300, bbox_inches='tight')
     print(f"Saved qos_metrics.png")
 
+def run_utility_visualizations(results_edf, results_rm, results_fifo):
+    """Generate the utility plots from one shared table of per-job utilities"""
+    utilities = compute_utility_table(results_edf, results_rm, results_fifo)
+    visualize_utility_curves(results_edf, results_rm, results_fifo, utilities)
+    visualize_cumulative_utility(results_edf, results_rm, results_fifo, utilities)
+    visualize_per_task_utility(results_edf, results_rm, results_fifo, utilities)
+
+def _run_visualization(func, args):
+    """Run one visualization in a worker process and return what it printed.
+
+    Figures are left open so later plots in the same worker reuse them.
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        func(*args)
+    return output.getvalue()
+
 def create_all_visualizations(results_edf, results_rm, results_fifo):
     """Generate all visualization plots"""
     print("\n" + "="*60)
     print("GENERATING VISUALIZATIONS")
     print("="*60)
     
-    # Gantt charts for each algorithm (first 5000ms for better visibility)
-    visualize_gantt_chart(results_edf, 'EDF', max_time=5000)
-    visualize_gantt_chart(results_rm, 'RM', max_time=5000)
-    visualize_gantt_chart(results_fifo, 'FIFO', max_time=5000)
-    
-    # Comparison metrics
-    visualize_comparison_metrics(results_edf, results_rm, results_fifo)
-    
-    # Task statistics
-    visualize_task_statistics(results_edf, results_rm, results_fifo)
-    
-    # Response time distribution
-    visualize_response_time_distribution(results_edf, results_rm, results_fifo)
-    
-    # Utility curves and analysis
-    visualize_utility_curves(results_edf, results_rm, results_fifo)
-    visualize_cumulative_utility(results_edf, results_rm, results_fifo)
-    visualize_per_task_utility(results_edf, results_rm, results_fifo)
-    
-    # M2M Latency Analysis (CRITICAL for your project)
-    visualize_latency_analysis(results_edf, results_rm, results_fifo)
+    # The plots read the cached per-job columns in results['jobs'], so the Job records
+    # are left out of what gets pickled to every worker
+    all_results = tuple({key: value for key, value in results.items() if key != 'completed_jobs'}
+                        for results in (results_edf, results_rm, results_fifo))
+    plots = [
+        # Gantt charts for each algorithm (first 5000ms for better visibility)
+        (visualize_gantt_chart, (all_results[0], 'EDF', 5000)),
+        (visualize_gantt_chart, (all_results[1], 'RM', 5000)),
+        (visualize_gantt_chart, (all_results[2], 'FIFO', 5000)),
+        # Comparison metrics
+        (visualize_comparison_metrics, all_results),
+        # Task statistics
+        (visualize_task_statistics, all_results),
+        # Response time distribution
+        (visualize_response_time_distribution, all_results),
+        # Utility curves and analysis
+        (run_utility_visualizations, all_results),
+        # M2M Latency Analysis (CRITICAL for your project)
+        (visualize_latency_analysis, all_results),
+        # NEW: Advanced visualizations
+        (visualize_deadline_miss_timeline, all_results),
+        (visualize_latency_heatmap, all_results),
+        (visualize_schedulability_analysis, all_results),
+        (visualize_qos_metrics, all_results)
+    ]
     
-    # NEW: Advanced visualizations
-    visualize_deadline_miss_timeline(results_edf, results_rm, results_fifo)
-    visualize_latency_heatmap(results_edf, results_rm, results_fifo)
-    visualize_schedulability_analysis(results_edf, results_rm, results_fifo)
-    visualize_qos_metrics(results_edf, results_rm, results_fifo)
+    # The plots are independent and CPU-bound in the Agg renderer, so render them in parallel;
+    # output is captured per plot and printed in the usual order
+    with ProcessPoolExecutor(max_workers=min(len(plots), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(_run_visualization, func, args) for func, args in plots]
+        for future in futures:
+            print(future.result(), end='')
     
     print("="*60)
     print("All visualizations saved successfully!")
@@ -1,4 +1,5 @@
 import socket
+import sys
 import threading
 import queue
 import re
@@ -8,6 +9,10 @@ import time
 
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 import numpy as np
 
 # ---------- CONFIG: match ESP32 settings ----------
@@ -33,58 +38,159 @@ delay_tolerant_tasks = ["Sound"]  # Monitoring/diagnostics
 
 # ---------- Queues & storage ----------
 
-line_queue = queue.Queue()
-
-# Completed job records (one dict per finished job)
-jobs = []
-
-# Partial data (we see EDF first, DONE later)
-job_partial = {}
-
-# Per-task time series
-waiting_times   = defaultdict(list)
-waiting_times_t = defaultdict(list)
-
-tardiness_vals   = defaultdict(list)
-tardiness_vals_t = defaultdict(list)
-
-frame_delay_vals   = defaultdict(list)   # only for periodic tasks
-frame_delay_vals_t = defaultdict(list)
-
-utility_vals   = defaultdict(list)       # per-task utility
-utility_vals_t = defaultdict(list)
-
-miss_rate_t = []
-miss_rate_v = []
+# Lines from the TCP thread; deque append/popleft are atomic, so no lock is needed
+line_queue = deque()
+
+# Completed jobs, one NumPy column per metric
+class JobTable:
+    """Append-only columns of every completed job, grown by doubling."""
+
+    COLUMNS = (("task", np.int16), ("waiting", np.int64), ("tardiness", np.int64),
+               ("resp_time", np.int64), ("utility", np.float64))
+
+    def __init__(self, capacity=4096):
+        self.n = 0
+        self.task_ids = {}   # task name -> value in the "task" column, by first appearance
+        for f, dtype in self.COLUMNS:
+            setattr(self, f, np.empty(capacity, dtype))
+
+    def __len__(self):
+        return self.n
+
+    def extend(self, names, waiting, tardiness, resp_time, utility):
+        """Append a batch of jobs; names is a sequence of task names."""
+        ids = self.task_ids
+        task = [ids.setdefault(name, len(ids)) for name in names]
+        i, j = self.n, self.n + len(task)
+        if j > len(self.task):
+            cap = len(self.task)
+            while cap < j:
+                cap *= 2
+            for f, _ in self.COLUMNS:
+                setattr(self, f, np.resize(getattr(self, f), cap))
+        self.task[i:j] = task
+        self.waiting[i:j] = waiting
+        self.tardiness[i:j] = tardiness
+        self.resp_time[i:j] = resp_time
+        self.utility[i:j] = utility
+        self.n = j
+
+    def col(self, field):
+        """The filled part of one column."""
+        return getattr(self, field)[:self.n]
+
+jobs = JobTable()
+
+# Most recent completed jobs, drawn on the execution timeline
+MAX_TIMELINE_JOBS = 80
+recent_jobs = deque(maxlen=MAX_TIMELINE_JOBS)
+
+# Partial data (we see EDF first, DONE later), in a small ring of slots per task
+# indexed by job number, so EDF lines whose DONE never arrives are overwritten
+PARTIAL_SLOTS = 64   # power of two
+job_partial = defaultdict(lambda: [None] * PARTIAL_SLOTS)
+
+# Per-task time series, one NumPy column per metric
+# Samples kept per plotted series; older jobs stay in the CSV and the task totals
+MAX_SERIES_POINTS = 10_000
+
+class TaskSeries:
+    """Per-task metric columns stored as float64 arrays, holding the newest `limit` samples."""
+
+    FIELDS = ("t", "wait", "tard", "resp", "util", "frame")
+
+    def __init__(self, capacity=1024, limit=MAX_SERIES_POINTS):
+        self.n = 0
+        self.limit = limit
+        for f in self.FIELDS:
+            setattr(self, f, np.empty(capacity))
+
+    def extend(self, t, wait, tard, resp, util, frame):
+        """Append equal-length arrays, one per field (frame is NaN for aperiodic tasks)."""
+        cols = (t, wait, tard, resp, util, frame)
+        if len(t) > self.limit:
+            cols = tuple(c[-self.limit:] for c in cols)
+        k = len(cols[0])
+        if self.n + k > len(self.t):
+            # Slide the samples still in the window to the front, growing by doubling
+            # until the buffer holds two windows; each sample is moved about once
+            keep = min(self.n, self.limit)
+            cap = len(self.t)
+            while cap < keep + k:
+                cap *= 2
+            for f in self.FIELDS:
+                old = getattr(self, f)
+                new = old if cap == len(old) else np.empty(cap)
+                new[:keep] = old[self.n - keep:self.n]
+                setattr(self, f, new)
+            self.n = keep
+        i, j = self.n, self.n + k
+        for f, c in zip(self.FIELDS, cols):
+            getattr(self, f)[i:j] = c
+        self.n = j
+
+    def col(self, field):
+        """The newest (up to `limit`) samples of one metric column."""
+        return getattr(self, field)[max(0, self.n - self.limit):self.n]
+
+series = {}   # task name -> TaskSeries, in order of first completed job
+sorted_task_names = ()   # sorted keys of series, refreshed when a new task completes
+
+miss_rate_t = deque(maxlen=MAX_SERIES_POINTS)
+miss_rate_v = deque(maxlen=MAX_SERIES_POINTS)
 
 # Global utility average
-global_util_t = []
-global_util_v = []
-
-# Response time tracking
-resp_time_vals = defaultdict(list)
-resp_time_vals_t = defaultdict(list)
+global_util_t = deque(maxlen=MAX_SERIES_POINTS)
+global_util_v = deque(maxlen=MAX_SERIES_POINTS)
+# Running totals over all completed jobs
+_miss_count = 0
+_util_sum = 0.0
+_resp_sum = 0
 
 # Task-specific statistics for summary
-task_stats = defaultdict(lambda: {
-    'jobs': 0,
-    'misses': 0,
-    'total_waiting': 0.0,
-    'total_tardiness': 0.0,
-    'total_resp_time': 0.0,
-    'total_utility': 0.0,
-    'max_waiting': 0.0,
-    'max_tardiness': 0.0,
-    'max_resp_time': 0.0
-})
+class TaskStats:
+    """Whole-session totals and maxima for one task."""
+
+    __slots__ = ("jobs", "misses", "total_waiting", "total_tardiness", "total_resp_time",
+                 "total_utility", "max_waiting", "max_tardiness", "max_resp_time")
+
+    def __init__(self):
+        self.jobs = 0
+        self.misses = 0
+        self.total_waiting = 0.0
+        self.total_tardiness = 0.0
+        self.total_resp_time = 0.0
+        self.total_utility = 0.0
+        self.max_waiting = 0.0
+        self.max_tardiness = 0.0
+        self.max_resp_time = 0.0
+
+    def record(self, waiting, tard, resp_time, util):
+        self.jobs += 1
+        if tard > 0:
+            self.misses += 1
+        self.total_waiting += waiting
+        self.total_tardiness += tard
+        self.total_resp_time += resp_time
+        self.total_utility += util
+        if waiting > self.max_waiting:
+            self.max_waiting = waiting
+        if tard > self.max_tardiness:
+            self.max_tardiness = tard
+        if resp_time > self.max_resp_time:
+            self.max_resp_time = resp_time
+
+task_stats = defaultdict(TaskStats)
 
 # Session start time
 session_start_time = time.time()
 
 # CSV
 csv_filename = "edf_results.csv"
-csv_header_written = False
-csv_lock = threading.Lock()
+CSV_FIELDS = ["name", "job", "rel", "start", "dl", "end", "val",
+              "waiting", "resp_time", "tardiness", "frame_delay", "utility"]
+CSV_BATCH_ROWS = 64
+csv_queue = queue.Queue()   # rows waiting for the writer thread
 
 # Regex patterns
 edf_re  = re.compile(r"EDF name=(\w+) job=(\d+) rel=(\d+) start=(\d+) dl=(\d+)")
@@ -96,15 +202,31 @@ task_message_count = defaultdict(int)
 # ---------- CSV helper ----------
 
 def write_csv_row(row):
-    global csv_header_written
-    with csv_lock:
-        write_header = not csv_header_written
-        with open(csv_filename, "a", newline="") as f:
-            w = csv.DictWriter(f, fieldnames=row.keys())
-            if write_header:
-                w.writeheader()
-                csv_header_written = True
-            w.writerow(row)
+    """Queue a completed job record for the CSV writer thread."""
+    csv_queue.put([row[k] for k in CSV_FIELDS])
+
+def csv_writer():
+    """Append queued rows to the CSV in batches, keeping the file open."""
+    f = None
+    w = None
+    while True:
+        batch = [csv_queue.get()]
+        while len(batch) < CSV_BATCH_ROWS:
+            try:
+                batch.append(csv_queue.get_nowait())
+            except queue.Empty:
+                break
+        if f is None:
+            f = open(csv_filename, "a", newline="", buffering=1 << 16)
+            w = csv.writer(f)
+            w.writerow(CSV_FIELDS)
+        w.writerows(batch)
+        f.flush()
+        for _ in batch:
+            csv_queue.task_done()
+
+csv_thread = threading.Thread(target=csv_writer, daemon=True)
+csv_thread.start()
 
 # ---------- TCP server ----------
 
@@ -118,17 +240,21 @@ def tcp_server(host="0.0.0.0", port=5000):
     conn, addr = s.accept()
     print(f"[SERVER] Connected by {addr}")
 
-    buf = ""
+    buf = bytearray()   # bytes after the last complete line
     try:
         while True:
-            data = conn.recv(1024)
+            data = conn.recv(65536)
             if not data:
                 print("[SERVER] Connection closed.")
                 break
-            buf += data.decode("utf-8", errors="ignore")
-            while "\n" in buf:
-                line, buf = buf.split("\n", 1)
-                line_queue.put(line.strip())
+            buf += data
+            # Decode and split all complete lines at once, keep the partial tail
+            end = buf.rfind(b"\n")
+            if end < 0:
+                continue
+            for line in buf[:end].decode("utf-8", errors="ignore").split("\n"):
+                line_queue.append(line.strip())
+            del buf[:end + 1]
     except Exception as e:
         print("[SERVER] Error:", e)
     finally:
@@ -140,123 +266,123 @@ server_thread.start()
 
 # ---------- Metrics helpers ----------
 
-def recompute_global_miss_rate():
-    if not jobs:
-        return 0.0
-    misses = sum(1 for j in jobs if j["tardiness"] > 0)
-    return misses / len(jobs)
-
 def calculate_utility(tardiness, scale, utility_type='soft'):
-    """Calculate utility based on different real-time models."""
-    if utility_type == 'hard':
-        # Hard real-time: utility drops to 0 if deadline missed
-        return 1.0 if tardiness <= 0 else 0.0
-    elif utility_type == 'soft':
+    """Calculate utility based on different real-time models.
+
+    Works elementwise on arrays; a job without a positive scale is scored hit/miss.
+    """
+    tardiness = np.asarray(tardiness, dtype=float)
+    scale = np.asarray(scale, dtype=float)
+    on_time = tardiness <= 0
+    if utility_type == 'soft':
         # Soft real-time: linear degradation after deadline
-        if tardiness <= 0:
-            return 1.0
-        else:
-            return max(0.0, 1.0 - tardiness / scale)
+        # (a ratio of 1 where there is no scale makes a late job worth 0)
+        ratio = np.divide(tardiness, scale, out=np.ones_like(tardiness), where=scale > 0)
+        return np.where(on_time, 1.0, np.maximum(0.0, 1.0 - ratio))
     elif utility_type == 'firm':
         # Firm real-time: similar to hard but occasional misses acceptable
-        if tardiness <= 0:
-            return 1.0
-        elif tardiness < scale * 0.2:  # Within 20% tolerance
-            return 0.5
-        else:
-            return 0.0
+        return np.where(on_time, 1.0, np.where(tardiness < scale * 0.2, 0.5, 0.0))  # Within 20% tolerance
     else:
-        return 1.0 if tardiness <= 0 else 0.0
+        # Hard real-time: utility drops to 0 if deadline missed
+        return np.where(on_time, 1.0, 0.0)
 
+# Console summary is printed at most this often
+SUMMARY_MIN_INTERVAL_S = 1.0
 _last_summary_job_count = 0
+_last_summary_time = 0.0
 
 def print_task_summary():
     """Print per-task summary stats to the console."""
-    global _last_summary_job_count
+    global _last_summary_job_count, _last_summary_time
     if len(jobs) == _last_summary_job_count:
         return  # nothing new
+    now = time.monotonic()
+    if now - _last_summary_time < SUMMARY_MIN_INTERVAL_S:
+        return
     _last_summary_job_count = len(jobs)
+    _last_summary_time = now
 
-    print("\n" + "="*60)
-    print(f"  EDF REAL-TIME PERFORMANCE SUMMARY ({len(jobs)} jobs)")
-    print("="*60)
+    # Build the whole report first and write it in one go
+    out = []
+    out.append("\n" + "="*60)
+    out.append(f"  EDF REAL-TIME PERFORMANCE SUMMARY ({len(jobs)} jobs)")
+    out.append("="*60)
     
     # Show task activity status
-    print("\n🔄 TASK ACTIVITY STATUS:")
+    out.append("\n🔄 TASK ACTIVITY STATUS:")
     for task in ["Ultra", "PIR", "Sound", "Button"]:
         count = task_message_count.get(task, 0)
         status = "✅ ACTIVE" if count > 0 else "⚠️  WAITING"
         task_type = "(Periodic)" if task in ["Ultra", "Sound"] else "(Event-Driven)"
-        print(f"   {task:8s} {task_type:15s}: {status:12s} - {count} messages received")
+        out.append(f"   {task:8s} {task_type:15s}: {status:12s} - {count} messages received")
     
     if task_message_count.get("Button", 0) == 0:
-        print("\n💡 TIP: Button is event-driven. Press the physical button on ESP32 to see data!")
+        out.append("\n💡 TIP: Button is event-driven. Press the physical button on ESP32 to see data!")
     
-    task_names = sorted({j["name"] for j in jobs})
+    task_names = sorted_task_names
     
     for name in task_names:
-        js = [j for j in jobs if j["name"] == name]
-        n  = len(js)
+        # Whole-session totals; the series only hold the newest samples
+        stats = task_stats[name]
+        n = stats.jobs
         if n == 0:
             continue
 
-        stats = task_stats[name]
-        
-        waits   = [j["waiting"] for j in js]
-        tards   = [j["tardiness"] for j in js]
-        resps   = [j["resp_time"] for j in js]
-        util    = [j["utility"] for j in js]
-        misses  = sum(1 for j in js if j["tardiness"] > 0)
+        misses  = stats.misses
 
-        avg_wait = sum(waits) / n
-        max_wait = max(waits)
+        avg_wait = stats.total_waiting / n
+        max_wait = stats.max_waiting
 
-        avg_tard = sum(tards) / n
-        max_tard = max(tards)
+        avg_tard = stats.total_tardiness / n
+        max_tard = stats.max_tardiness
 
-        avg_resp = sum(resps) / n
-        max_resp = max(resps)
+        avg_resp = stats.total_resp_time / n
+        max_resp = stats.max_resp_time
 
-        avg_util = sum(util) / n
+        avg_util = stats.total_utility / n
         miss_rate = misses / n
         
         # Classify task type
         task_type = "Delay-Sensitive" if name in delay_sensitive_tasks else "Delay-Tolerant"
 
-        print(f"\n📊 Task: {name} ({task_type})")
-        print(f"   Jobs Completed : {n}")
-        print(f"   Deadline Misses: {misses}  (miss rate = {miss_rate*100:.1f}%)")
-        print(f"   Waiting Time   : avg {avg_wait:.2f} ms, max {max_wait:.2f} ms")
-        print(f"   Tardiness      : avg {avg_tard:.2f} ms, max {max_tard:.2f} ms")
-        print(f"   Response Time  : avg {avg_resp:.2f} ms, max {max_resp:.2f} ms")
-        print(f"   Utility        : avg {avg_util:.3f}")
+        out.append(f"\n📊 Task: {name} ({task_type})")
+        out.append(f"   Jobs Completed : {n}")
+        out.append(f"   Deadline Misses: {misses}  (miss rate = {miss_rate*100:.1f}%)")
+        out.append(f"   Waiting Time   : avg {avg_wait:.2f} ms, max {max_wait:.2f} ms")
+        out.append(f"   Tardiness      : avg {avg_tard:.2f} ms, max {max_tard:.2f} ms")
+        out.append(f"   Response Time  : avg {avg_resp:.2f} ms, max {max_resp:.2f} ms")
+        out.append(f"   Utility        : avg {avg_util:.3f}")
     
     # Global statistics
     if jobs:
-        global_miss_rate = recompute_global_miss_rate()
-        global_avg_util = sum(j["utility"] for j in jobs) / len(jobs)
-        global_avg_resp = sum(j["resp_time"] for j in jobs) / len(jobs)
+        global_miss_rate = _miss_count / len(jobs)
+        global_avg_util = _util_sum / len(jobs)
+        global_avg_resp = _resp_sum / len(jobs)
         
-        print("\n" + "-"*60)
-        print(f"🌐 GLOBAL METRICS")
-        print(f"   Total Jobs        : {len(jobs)}")
-        print(f"   Global Miss Rate  : {global_miss_rate*100:.1f}%")
-        print(f"   Global Avg Utility: {global_avg_util:.3f}")
-        print(f"   Global Avg Resp   : {global_avg_resp:.2f} ms")
+        out.append("\n" + "-"*60)
+        out.append(f"🌐 GLOBAL METRICS")
+        out.append(f"   Total Jobs        : {len(jobs)}")
+        out.append(f"   Global Miss Rate  : {global_miss_rate*100:.1f}%")
+        out.append(f"   Global Avg Utility: {global_avg_util:.3f}")
+        out.append(f"   Global Avg Resp   : {global_avg_resp:.2f} ms")
         
         # Session duration
         elapsed = time.time() - session_start_time
-        print(f"   Session Duration  : {elapsed:.1f} seconds")
+        out.append(f"   Session Duration  : {elapsed:.1f} seconds")
     
-    print("="*60 + "\n")
+    out.append("="*60 + "\n")
+    sys.stdout.write("\n".join(out) + "\n")
 
 # ---------- Matplotlib live plots ----------
 
 plt.style.use("seaborn-v0_8-darkgrid")
+# Dashboard grid style comes from rcParams, so cleared axes get it back without a grid() call
+plt.rcParams.update({'grid.alpha': 0.4, 'grid.linestyle': '--', 'grid.linewidth': 0.7})
 
 # Create comprehensive dashboard with multiple subplots
-fig = plt.figure(figsize=(20, 13))
-gs = fig.add_gridspec(4, 3, hspace=0.4, wspace=0.35, top=0.96, bottom=0.05, left=0.06, right=0.98)
+# Constrained layout re-solves spacing as part of each draw, so frames need no tight_layout()
+fig = plt.figure(figsize=(20, 13), layout='constrained')
+gs = fig.add_gridspec(4, 3)
 
 # Row 1: Main metrics
 ax_resp = fig.add_subplot(gs[0, 0])      # Response time
@@ -297,239 +423,199 @@ MARKER_SIZE_LINE = 6
 MARKER_SIZE_TIMELINE = 200
 LINE_WIDTH = 2.0
 
-def update(frame):
-    # ---- Drain queue & parse new lines ----
-    while True:
-        try:
-            line = line_queue.get_nowait()
-        except queue.Empty:
-            break
-
-        if not line:
-            continue
-
-        m = edf_re.match(line)
-        if m:
-            name, job, rel, start, dl = m.groups()
-            key = (name, int(job))
-            job_partial.setdefault(key, {})
-            job_partial[key].update({
-                "name":  name,
-                "job":   int(job),
-                "rel":   int(rel),
-                "start": int(start),
-                "dl":    int(dl),
-            })
-            task_message_count[name] += 1
-            continue
-
-        m = done_re.match(line)
-        if m:
-            name, job, end, val = m.groups()
-            key = (name, int(job))
-            p = job_partial.get(key)
-            if not p:
-                continue  # missed EDF line, skip
-            p["end"] = int(end)
-            p["val"] = int(val)
-
-            # Metrics
-            rel   = p["rel"]
-            start = p["start"]
-            dl    = p["dl"]
-            end_t = p["end"]
-
-            waiting   = start - rel
-            resp_time = end_t - rel
-            tard      = max(0, end_t - dl)
-
-            p["waiting"]    = waiting
-            p["resp_time"]  = resp_time
-            p["tardiness"]  = tard
-
-            # Frame delay (for periodic tasks)
-            period = period_map.get(name)
-            if period is not None and period > 0:
-                frame_delay = waiting / period
-            else:
-                frame_delay = None
-            p["frame_delay"] = frame_delay
-
-            # Utility (soft real-time model)
-            scale = scale_map.get(name, None)
-            if scale is None or scale <= 0:
-                util = 1.0 if tard == 0 else 0.0
-            else:
-                util = calculate_utility(tard, scale, 'soft')
-            p["utility"] = util
-
-            jobs.append(p)
-
-            t_ms = end_t
-
-            # Update task statistics
-            stats = task_stats[name]
-            stats['jobs'] += 1
-            if tard > 0:
-                stats['misses'] += 1
-            stats['total_waiting'] += waiting
-            stats['total_tardiness'] += tard
-            stats['total_resp_time'] += resp_time
-            stats['total_utility'] += util
-            stats['max_waiting'] = max(stats['max_waiting'], waiting)
-            stats['max_tardiness'] = max(stats['max_tardiness'], tard)
-            stats['max_resp_time'] = max(stats['max_resp_time'], resp_time)
-
-            # time series
-            waiting_times[name].append(waiting)
-            waiting_times_t[name].append(t_ms)
-
-            tardiness_vals[name].append(tard)
-            tardiness_vals_t[name].append(t_ms)
-            
-            resp_time_vals[name].append(resp_time)
-            resp_time_vals_t[name].append(t_ms)
-
-            if frame_delay is not None:
-                frame_delay_vals[name].append(frame_delay)
-                frame_delay_vals_t[name].append(t_ms)
-
-            utility_vals[name].append(util)
-            utility_vals_t[name].append(t_ms)
-
-            # global miss rate
-            mr = recompute_global_miss_rate()
-            miss_rate_t.append(t_ms)
-            miss_rate_v.append(mr)
-
-            # global avg utility
-            avg_u = sum(j["utility"] for j in jobs) / len(jobs)
-            global_util_t.append(t_ms)
-            global_util_v.append(avg_u)
-
-            # CSV
-            write_csv_row(p)
-
-            # cleanup
-            del job_partial[key]
-
-    # print per-task summary when new jobs arrive
-    print_task_summary()
-
-    # ---- Update plots ----
-    
-    # Clear all axes
-    for ax in [ax_resp, ax_wait, ax_tard, ax_util, ax_frame, ax_miss, 
-               ax_resp_dist, ax_util_box, ax_latency, ax_timeline]:
+# Text box styles (Text copies these, so one dict can back every box)
+TITLE_FONTSIZE = 16
+TITLE_BOX_PAD = 0.8   # in units of the font size
+TITLE_BBOX = dict(boxstyle=f'round,pad={TITLE_BOX_PAD}', facecolor='#2C3E50',
+                  alpha=0.9, edgecolor='white', linewidth=2)
+STATS_BBOX = dict(boxstyle='round,pad=0.8', facecolor='#F8F9FA',
+                  alpha=0.95, edgecolor='black', linewidth=2)
+SENSITIVE_BBOX = dict(boxstyle='round,pad=0.5', facecolor='#E63946',
+                      alpha=0.7, edgecolor='black', linewidth=1.5)
+TOLERANT_BBOX = dict(boxstyle='round,pad=0.5', facecolor='#FFB703',
+                     alpha=0.7, edgecolor='black', linewidth=1.5)
+
+def reserve_title_box(figure):
+    """Leave room under a constrained-layout suptitle for its TITLE_BBOX padding.
+
+    The layout only sizes the title text, so the box would cover the top row's titles.
+    """
+    pad = TITLE_BOX_PAD * TITLE_FONTSIZE / 72 / figure.get_figheight()
+    figure.get_layout_engine().set(rect=(0, 0, 1, 1 - pad))
+
+# Most points drawn per time series; an axes is only ~1000 px wide, so more is wasted work
+MAX_PLOT_POINTS = 2000
+
+def downsample_minmax(xs, ys, n_out=MAX_PLOT_POINTS):
+    """Reduce a time series to about n_out points, keeping the min and max of each bucket."""
+    n = len(xs)
+    if n <= n_out:
+        return xs, ys
+    xs = np.asarray(xs)
+    ys = np.asarray(ys, dtype=float)
+
+    # Equal-count buckets over the (time-ordered) samples; pad the last one with NaN
+    size = -(-n // (n_out // 2))
+    n_buckets = -(-n // size)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = ys
+    buckets = padded.reshape(n_buckets, size)
+    base = np.arange(n_buckets) * size
+    keep = np.unique(np.concatenate((base + np.nanargmin(buckets, axis=1),
+                                     base + np.nanargmax(buckets, axis=1),
+                                     [0, n - 1])))
+    return xs[keep], ys[keep]
+
+# ---------- Static axes decoration (set up once, lines updated per frame) ----------
+
+# Task name -> Line2D per axes, created on a task's first completed job
+lines_resp  = {}
+lines_wait  = {}
+lines_tard  = {}
+lines_util  = {}
+lines_frame = {}
+
+# Line styles per task, built once; the utility axes uses small dots instead of symbols
+def _task_line_style(name):
+    return dict(marker=task_symbols.get(name, 'o'), color=task_colors.get(name, 'gray'),
+                alpha=0.8, markersize=MARKER_SIZE_LINE, linewidth=LINE_WIDTH,
+                markeredgecolor='white', markeredgewidth=0.5)
+
+def _util_line_style(name):
+    return dict(marker='.', color=task_colors.get(name, 'gray'),
+                alpha=0.7, markersize=4, linewidth=LINE_WIDTH)
+
+TASK_LINE_STYLES = {name: _task_line_style(name) for name in task_colors}
+UTIL_LINE_STYLES = {name: _util_line_style(name) for name in task_colors}
+
+def task_line(lines, ax, name):
+    """Return the Line2D for a task on ax, creating it (and refreshing the legend) on first use."""
+    line = lines.get(name)
+    if line is None:
+        if ax is ax_util:
+            style = UTIL_LINE_STYLES.get(name) or _util_line_style(name)
+        else:
+            style = TASK_LINE_STYLES.get(name) or _task_line_style(name)
+        line, = ax.plot([], [], label=name, **style)
+        lines[name] = line
+        if ax is ax_util:
+            ax.legend(handles=[*lines.values(), global_util_line], loc="lower left",
+                      fontsize=9, framealpha=0.95, edgecolor='black')
+        else:
+            ax.legend(handles=list(lines.values()), loc="upper left",
+                      fontsize=9, framealpha=0.95, edgecolor='black')
+    return line
+
+# ========== Row 1: Main Timing Metrics ==========
+
+# 1) Response Time over time
+ax_resp.set_ylabel("Response Time (ms)", fontsize=11, fontweight='bold')
+ax_resp.set_title("Response Time: Release → Completion", fontsize=12, fontweight='bold', pad=10)
+ax_resp.set_xlabel("Time (ms)", fontsize=10)
+
+# 2) Waiting time
+ax_wait.set_ylabel("Waiting Time (ms)", fontsize=11, fontweight='bold')
+ax_wait.set_title("Waiting Time: Release → Start", fontsize=12, fontweight='bold', pad=10)
+ax_wait.set_xlabel("Time (ms)", fontsize=10)
+
+# 3) Tardiness
+ax_tard.set_ylabel("Tardiness (ms)", fontsize=11, fontweight='bold')
+ax_tard.set_title("Tardiness: Deadline Miss Amount", fontsize=12, fontweight='bold', pad=10)
+ax_tard.axhline(y=0, color='#2ECC71', linestyle='-', linewidth=2, alpha=0.6, label='On-time threshold')
+ax_tard.set_xlabel("Time (ms)", fontsize=10)
+
+# ========== Row 2: Advanced Metrics ==========
+
+# 4) Utility curves (per-task + global)
+# Global average utility - thicker line
+global_util_line, = ax_util.plot([], [], 'k-', linewidth=3.5,
+                                 label="Global Average", alpha=0.9, zorder=10)
+ax_util.set_ylabel("Utility", fontsize=11, fontweight='bold')
+ax_util.set_ylim(-0.05, 1.05)
+ax_util.set_title("Utility Function (1=Perfect, 0=Failed)", fontsize=12, fontweight='bold', pad=10)
+ax_util.axhline(y=0.5, color='#F39C12', linestyle='--', linewidth=2, alpha=0.7, label='50% threshold')
+ax_util.axhline(y=0.8, color='#2ECC71', linestyle='--', linewidth=1.5, alpha=0.5)
+ax_util.set_xlabel("Time (ms)", fontsize=10)
+
+# 5) Frame delay (periodic tasks only)
+ax_frame.set_ylabel("Frame Delay (frames)", fontsize=11, fontweight='bold')
+ax_frame.set_title("Frame Delay = Waiting ÷ Period", fontsize=12, fontweight='bold', pad=10)
+ax_frame.axhline(y=1.0, color='#E74C3C', linestyle='--', linewidth=2, alpha=0.6, label='1 frame late')
+ax_frame.set_xlabel("Time (ms)", fontsize=10)
+
+# 6) Cumulative miss rate
+miss_line, = ax_miss.plot([], [], 'r-', linewidth=3)
+miss_fill = None
+ax_miss.set_ylabel("Miss Rate", fontsize=11, fontweight='bold')
+ax_miss.set_ylim(-0.05, 1.05)
+ax_miss.set_title("Cumulative Deadline Miss Rate", fontsize=12, fontweight='bold', pad=10)
+ax_miss.axhline(y=0.05, color='#F39C12', linestyle='--', linewidth=2, alpha=0.7, label='5% acceptable')
+ax_miss.axhline(y=0.1, color='#E74C3C', linestyle='--', linewidth=2, alpha=0.7, label='10% critical')
+ax_miss.legend(loc='upper left', fontsize=9, framealpha=0.95, edgecolor='black')
+ax_miss.set_xlabel("Time (ms)", fontsize=10)
+
+# ========== Row 4: Execution Timeline ==========
+
+# 10) Fixed decoration is set once; draw_job_panels only swaps the job artists and texts
+TIMELINE_TASKS = ("Ultra", "PIR", "Sound", "Button")
+TIMELINE_Y = {name: i for i, name in enumerate(TIMELINE_TASKS)}
+TIMELINE_COLORS = np.array([task_colors.get(name, 'blue') for name in TIMELINE_TASKS])
+timeline_artists = []
+ax_timeline.set_yticks(range(len(TIMELINE_TASKS)))
+ax_timeline.set_ylim(-0.5, len(TIMELINE_TASKS) - 0.5)
+ax_timeline.set_xlabel("Time (ms)", fontsize=11, fontweight='bold')
+ax_timeline.grid(True, alpha=0.3, axis='x', linestyle='--', linewidth=0.7)
+timeline_title = ax_timeline.set_title("", fontsize=12, fontweight='bold', pad=10)
+ax_timeline.legend(handles=[
+    Line2D([0], [0], marker='o', color='w', markerfacecolor='#2ECC71',
+           markersize=10, label='On Time', markeredgecolor='black', markeredgewidth=1.5),
+    Line2D([0], [0], marker='o', color='w', markerfacecolor='#E74C3C',
+           markersize=10, label='Missed Deadline', markeredgecolor='black', markeredgewidth=1.5)
+], loc='upper right', fontsize=10, framealpha=0.95, edgecolor='black', fancybox=True, shadow=True)
+timeline_stats_text = ax_timeline.text(0.5, -0.15, '', transform=ax_timeline.transAxes,
+                                       fontsize=10, verticalalignment='top', ha='center',
+                                       bbox=STATS_BBOX,
+                                       fontweight='bold')
+
+# Main title with better styling
+fig.suptitle('🔴 ESP32 EDF Real-Time Scheduler - Live Performance Dashboard', 
+             fontsize=TITLE_FONTSIZE, fontweight='bold',
+             bbox=TITLE_BBOX,
+             color='white')
+reserve_title_box(fig)
+
+# Resolution of the dashboard snapshot written on close (the summary stays at 200)
+DASHBOARD_DPI = 120
+# Job count at the last save; the job table only grows, so an equal count means nothing changed
+_last_saved_job_count = 0
+# Summary figure, built on the first save and cleared per axes on later ones
+summary_fig = None
+
+# Rebuild the box plot and timeline panels after this many new jobs, or this many seconds
+PANEL_REDRAW_JOBS = 10
+PANEL_MAX_AGE_S = 2.0
+_last_drawn_job_count = 0
+_last_drawn_time = 0.0
+
+def draw_job_panels():
+    """Rebuild the distribution and timeline panels (rows 3-4) from all completed jobs."""
+    global _last_drawn_job_count, _last_drawn_time
+    _last_drawn_job_count = len(jobs)
+    _last_drawn_time = time.time()
+
+    for ax in (ax_resp_dist, ax_util_box, ax_latency):
         ax.clear()
-
-    # ========== Row 1: Main Timing Metrics ==========
-    
-    # 1) Response Time over time
-    for name, xs in resp_time_vals_t.items():
-        ys = resp_time_vals[name]
-        if xs:
-            ax_resp.plot(xs, ys, marker=task_symbols.get(name, 'o'), 
-                        color=task_colors.get(name, 'gray'), 
-                        label=name, alpha=0.8, markersize=MARKER_SIZE_LINE, 
-                        linewidth=LINE_WIDTH, markeredgecolor='white', markeredgewidth=0.5)
-    ax_resp.set_ylabel("Response Time (ms)", fontsize=11, fontweight='bold')
-    ax_resp.set_title("Response Time: Release → Completion", fontsize=12, fontweight='bold', pad=10)
-    ax_resp.legend(loc="upper left", fontsize=9, framealpha=0.95, edgecolor='black')
-    ax_resp.grid(True, alpha=0.4, linestyle='--', linewidth=0.7)
-    ax_resp.set_xlabel("Time (ms)", fontsize=10)
-
-    # 2) Waiting time
-    for name, xs in waiting_times_t.items():
-        ys = waiting_times[name]
-        if xs:
-            ax_wait.plot(xs, ys, marker=task_symbols.get(name, 'o'), 
-                        color=task_colors.get(name, 'gray'),
-                        label=name, alpha=0.8, markersize=MARKER_SIZE_LINE, 
-                        linewidth=LINE_WIDTH, markeredgecolor='white', markeredgewidth=0.5)
-    ax_wait.set_ylabel("Waiting Time (ms)", fontsize=11, fontweight='bold')
-    ax_wait.set_title("Waiting Time: Release → Start", fontsize=12, fontweight='bold', pad=10)
-    ax_wait.legend(loc="upper left", fontsize=9, framealpha=0.95, edgecolor='black')
-    ax_wait.grid(True, alpha=0.4, linestyle='--', linewidth=0.7)
-    ax_wait.set_xlabel("Time (ms)", fontsize=10)
-
-    # 3) Tardiness
-    for name, xs in tardiness_vals_t.items():
-        ys = tardiness_vals[name]
-        if xs:
-            ax_tard.plot(xs, ys, marker=task_symbols.get(name, 'o'),
-                        color=task_colors.get(name, 'gray'),
-                        label=name, alpha=0.8, markersize=MARKER_SIZE_LINE, 
-                        linewidth=LINE_WIDTH, markeredgecolor='white', markeredgewidth=0.5)
-    ax_tard.set_ylabel("Tardiness (ms)", fontsize=11, fontweight='bold')
-    ax_tard.set_title("Tardiness: Deadline Miss Amount", fontsize=12, fontweight='bold', pad=10)
-    ax_tard.legend(loc="upper left", fontsize=9, framealpha=0.95, edgecolor='black')
-    ax_tard.grid(True, alpha=0.4, linestyle='--', linewidth=0.7)
-    ax_tard.axhline(y=0, color='#2ECC71', linestyle='-', linewidth=2, alpha=0.6, label='On-time threshold')
-    ax_tard.set_xlabel("Time (ms)", fontsize=10)
-
-    # ========== Row 2: Advanced Metrics ==========
-
-    # 4) Utility curves (per-task + global)
-    for name, xs in utility_vals_t.items():
-        ys = utility_vals[name]
-        if xs:
-            ax_util.plot(xs, ys, marker='.', 
-                        color=task_colors.get(name, 'gray'),
-                        label=f"{name}", alpha=0.7, markersize=4, linewidth=LINE_WIDTH)
-    # Global average utility - thicker line
-    if global_util_t:
-        ax_util.plot(global_util_t, global_util_v, 'k-', linewidth=3.5,
-                     label="Global Average", alpha=0.9, zorder=10)
-    ax_util.set_ylabel("Utility", fontsize=11, fontweight='bold')
-    ax_util.set_ylim(-0.05, 1.05)
-    ax_util.set_title("Utility Function (1=Perfect, 0=Failed)", fontsize=12, fontweight='bold', pad=10)
-    ax_util.legend(loc="lower left", fontsize=9, framealpha=0.95, edgecolor='black')
-    ax_util.grid(True, alpha=0.4, linestyle='--', linewidth=0.7)
-    ax_util.axhline(y=0.5, color='#F39C12', linestyle='--', linewidth=2, alpha=0.7, label='50% threshold')
-    ax_util.axhline(y=0.8, color='#2ECC71', linestyle='--', linewidth=1.5, alpha=0.5)
-    ax_util.set_xlabel("Time (ms)", fontsize=10)
-
-    # 5) Frame delay (periodic tasks only)
-    for name, xs in frame_delay_vals_t.items():
-        ys = frame_delay_vals[name]
-        if xs:
-            ax_frame.plot(xs, ys, marker=task_symbols.get(name, 'o'),
-                         color=task_colors.get(name, 'gray'),
-                         label=name, alpha=0.8, markersize=MARKER_SIZE_LINE, 
-                         linewidth=LINE_WIDTH, markeredgecolor='white', markeredgewidth=0.5)
-    ax_frame.set_ylabel("Frame Delay (frames)", fontsize=11, fontweight='bold')
-    ax_frame.set_title("Frame Delay = Waiting ÷ Period", fontsize=12, fontweight='bold', pad=10)
-    ax_frame.legend(loc="upper left", fontsize=9, framealpha=0.95, edgecolor='black')
-    ax_frame.grid(True, alpha=0.4, linestyle='--', linewidth=0.7)
-    ax_frame.axhline(y=1.0, color='#E74C3C', linestyle='--', linewidth=2, alpha=0.6, label='1 frame late')
-    ax_frame.set_xlabel("Time (ms)", fontsize=10)
-
-    # 6) Cumulative miss rate
-    if miss_rate_t:
-        ax_miss.plot(miss_rate_t, miss_rate_v, 'r-', linewidth=3)
-        ax_miss.fill_between(miss_rate_t, 0, miss_rate_v, alpha=0.25, color='#E74C3C')
-    ax_miss.set_ylabel("Miss Rate", fontsize=11, fontweight='bold')
-    ax_miss.set_ylim(-0.05, 1.05)
-    ax_miss.set_title("Cumulative Deadline Miss Rate", fontsize=12, fontweight='bold', pad=10)
-    ax_miss.grid(True, alpha=0.4, linestyle='--', linewidth=0.7)
-    ax_miss.axhline(y=0.05, color='#F39C12', linestyle='--', linewidth=2, alpha=0.7, label='5% acceptable')
-    ax_miss.axhline(y=0.1, color='#E74C3C', linestyle='--', linewidth=2, alpha=0.7, label='10% critical')
-    ax_miss.legend(loc='upper left', fontsize=9, framealpha=0.95, edgecolor='black')
-    ax_miss.set_xlabel("Time (ms)", fontsize=10)
+        ax.xaxis.grid(False)   # distributions only keep the y grid
+    for artist in timeline_artists:
+        artist.remove()
+    timeline_artists.clear()
 
     # ========== Row 3: Distribution Analysis ==========
 
     # 7) Response time distribution (box plot)
     if jobs:
-        task_names_sorted = sorted({j["name"] for j in jobs})
-        resp_data = []
-        labels = []
-        for name in task_names_sorted:
-            resp_vals = [j["resp_time"] for j in jobs if j["name"] == name]
-            if resp_vals:
-                resp_data.append(resp_vals)
-                labels.append(name)
+        labels = sorted_task_names
+        resp_data = [series[name].col("resp") for name in labels]
         
         if resp_data:
             bp = ax_resp_dist.boxplot(resp_data, labels=labels, patch_artist=True, 
@@ -546,19 +632,12 @@ def update(frame):
             
             ax_resp_dist.set_ylabel("Response Time (ms)", fontsize=11, fontweight='bold')
             ax_resp_dist.set_title("Response Time Distribution per Task", fontsize=12, fontweight='bold', pad=10)
-            ax_resp_dist.grid(True, alpha=0.4, axis='y', linestyle='--', linewidth=0.7)
             ax_resp_dist.set_xlabel("Task", fontsize=10, fontweight='bold')
 
     # 8) Utility box plots
     if jobs:
-        task_names_sorted = sorted({j["name"] for j in jobs})
-        util_data = []
-        labels = []
-        for name in task_names_sorted:
-            util_vals = [j["utility"] for j in jobs if j["name"] == name]
-            if util_vals:
-                util_data.append(util_vals)
-                labels.append(name)
+        labels = sorted_task_names
+        util_data = [series[name].col("util") for name in labels]
         
         if util_data:
             bp = ax_util_box.boxplot(util_data, labels=labels, patch_artist=True,
@@ -575,26 +654,27 @@ def update(frame):
             ax_util_box.set_ylabel("Utility", fontsize=11, fontweight='bold')
             ax_util_box.set_ylim(-0.05, 1.05)
             ax_util_box.set_title("Utility Distribution per Task", fontsize=12, fontweight='bold', pad=10)
-            ax_util_box.grid(True, alpha=0.4, axis='y', linestyle='--', linewidth=0.7)
             ax_util_box.axhline(y=0.8, color='#2ECC71', linestyle='--', linewidth=1.5, alpha=0.5)
             ax_util_box.set_xlabel("Task", fontsize=10, fontweight='bold')
 
     # 9) M2M Latency Classification
     if jobs:
         # Classify by delay sensitivity
-        delay_sens_resp = [j["resp_time"] for j in jobs if j["name"] in delay_sensitive_tasks]
-        delay_tol_resp = [j["resp_time"] for j in jobs if j["name"] in delay_tolerant_tasks]
+        delay_sens_resp = np.concatenate([ts.col("resp") for name, ts in series.items()
+                                          if name in delay_sensitive_tasks] or [[]])
+        delay_tol_resp = np.concatenate([ts.col("resp") for name, ts in series.items()
+                                         if name in delay_tolerant_tasks] or [[]])
         
         data_to_plot = []
         labels_to_plot = []
         colors_to_plot = []
         
-        if delay_sens_resp:
+        if delay_sens_resp.size:
             data_to_plot.append(delay_sens_resp)
             labels_to_plot.append("Delay-\nSensitive")
             colors_to_plot.append('#E63946')
         
-        if delay_tol_resp:
+        if delay_tol_resp.size:
             data_to_plot.append(delay_tol_resp)
             labels_to_plot.append("Delay-\nTolerant")
             colors_to_plot.append('#FFB703')
@@ -614,17 +694,16 @@ def update(frame):
                 patch.set_linewidth(2)
             
             # Add statistics with better formatting
-            if delay_sens_resp:
+            if delay_sens_resp.size:
                 avg_sens = np.mean(delay_sens_resp)
                 max_sens = np.max(delay_sens_resp)
                 stats_text = f'Avg: {avg_sens:.1f}ms\nMax: {max_sens:.1f}ms'
                 ax_latency.text(1, 0.98, stats_text, 
                                transform=ax_latency.transAxes, 
                                fontsize=9, verticalalignment='top',
-                               bbox=dict(boxstyle='round,pad=0.5', facecolor='#E63946', 
-                                       alpha=0.7, edgecolor='black', linewidth=1.5),
+                               bbox=SENSITIVE_BBOX,
                                color='white', fontweight='bold', ha='right')
-            if delay_tol_resp:
+            if delay_tol_resp.size:
                 avg_tol = np.mean(delay_tol_resp)
                 max_tol = np.max(delay_tol_resp)
                 stats_text = f'Avg: {avg_tol:.1f}ms\nMax: {max_tol:.1f}ms'
@@ -632,216 +711,330 @@ def update(frame):
                                transform=ax_latency.transAxes,
                                fontsize=9, verticalalignment='bottom', 
                                horizontalalignment='right',
-                               bbox=dict(boxstyle='round,pad=0.5', facecolor='#FFB703',
-                                       alpha=0.7, edgecolor='black', linewidth=1.5),
+                               bbox=TOLERANT_BBOX,
                                color='black', fontweight='bold')
             
             ax_latency.set_ylabel("Latency (ms)", fontsize=11, fontweight='bold')
             ax_latency.set_title("M2M Traffic Classification (Industrial IoT)", fontsize=12, fontweight='bold', pad=10)
-            ax_latency.grid(True, alpha=0.4, axis='y', linestyle='--', linewidth=0.7)
             ax_latency.set_xlabel("Traffic Class", fontsize=10, fontweight='bold')
 
     # ========== Row 4: Execution Timeline (Gantt-style) ==========
     
     if jobs:
-        # Show last N jobs for clarity
-        max_jobs_display = 80
-        recent_jobs = jobs[-max_jobs_display:] if len(jobs) > max_jobs_display else jobs
-        
-        task_names_sorted = ["Ultra", "PIR", "Sound", "Button"]
-        task_y_pos = {name: i for i, name in enumerate(task_names_sorted)}
-        
-        for job in recent_jobs:
-            name = job["name"]
-            if name not in task_y_pos:
-                continue
-            
-            y_pos = task_y_pos[name]
-            start = job["start"]
-            end = job["end"]
-            duration = end - start
-            
-            # Color based on deadline miss
-            is_late = job["tardiness"] > 0
-            color = '#E74C3C' if is_late else task_colors.get(name, 'blue')
-            alpha_marker = 0.9
-            
-            # Draw execution block with enhanced visibility
-            ax_timeline.scatter(start, y_pos, 
-                              marker=task_symbols.get(name, 'o'),
-                              s=MARKER_SIZE_TIMELINE, color=color, alpha=alpha_marker, 
-                              edgecolors='black', linewidths=1.5, zorder=5)
-            
-            # Background shading for duration
-            ax_timeline.barh(y_pos, duration, left=start, height=0.4,
-                           color=color, alpha=0.3, edgecolor='none', zorder=2)
-            
+        shown = [j for j in recent_jobs if j["name"] in TIMELINE_Y]
+        if shown:
+            n = len(shown)
+            starts = np.fromiter((j["start"] for j in shown), dtype=np.float64, count=n)
+            ends   = np.fromiter((j["end"] for j in shown), dtype=np.float64, count=n)
+            y_pos  = np.fromiter((TIMELINE_Y[j["name"]] for j in shown), dtype=np.intp, count=n)
+            missed = np.fromiter((j["tardiness"] > 0 for j in shown), dtype=bool, count=n)
+
+            # Color based on deadline miss, otherwise the task's color by row
+            colors = np.where(missed, '#E74C3C', TIMELINE_COLORS[y_pos])
+
+            # Background shading for duration, all bars in one collection
+            bottom, top = y_pos - 0.2, y_pos + 0.2
+            verts = np.stack([np.column_stack(corner) for corner in
+                              ((starts, bottom), (starts, top), (ends, top), (ends, bottom))], axis=1)
+            timeline_artists.append(ax_timeline.add_collection(
+                PolyCollection(verts, facecolors=colors, alpha=0.3, edgecolors='none', zorder=2)))
+
+            # Execution start markers, one scatter per task since each has its own symbol
+            for name in TIMELINE_TASKS:
+                mask = y_pos == TIMELINE_Y[name]
+                if mask.any():
+                    timeline_artists.append(ax_timeline.scatter(
+                        starts[mask], y_pos[mask], marker=task_symbols.get(name, 'o'),
+                        s=MARKER_SIZE_TIMELINE, color=colors[mask], alpha=0.9,
+                        edgecolors='black', linewidths=1.5, zorder=5))
+
+            # Old artists stay in the data limits, so the x range is set from the shown jobs
+            min_time, max_time = starts.min(), ends.max()
+            time_range = max_time - min_time
+            margin = 0.05 * time_range if time_range else 1
+            ax_timeline.set_xlim(min_time - margin, max_time + margin)
+
             # Add vertical separator every 1000ms
-            if len(recent_jobs) > 0:
-                min_time = min(j["start"] for j in recent_jobs)
-                max_time = max(j["end"] for j in recent_jobs)
-                time_range = max_time - min_time
-                if time_range > 2000:  # Only add separators if range is large
-                    sep_start = int(min_time / 1000) * 1000
-                    for sep_time in range(sep_start, int(max_time) + 1000, 1000):
-                        if sep_time > min_time:
-                            ax_timeline.axvline(x=sep_time, color='gray', linestyle=':', 
-                                              linewidth=1, alpha=0.4, zorder=1)
+            if time_range > 2000:  # Only add separators if range is large
+                sep_start = int(min_time / 1000) * 1000
+                for sep_time in range(sep_start, int(max_time) + 1000, 1000):
+                    if sep_time > min_time:
+                        timeline_artists.append(ax_timeline.axvline(
+                            x=sep_time, color='gray', linestyle=':', linewidth=1, alpha=0.4, zorder=1))
         
         # Build y-tick labels with activity indicators
-        ytick_labels = []
-        for name in task_names_sorted:
-            job_count = len([j for j in jobs if j["name"] == name])
-            if job_count > 0:
-                ytick_labels.append(f"{name} ✓")  # Active task
-            else:
-                ytick_labels.append(f"{name} ⚠")  # No data yet
+        ax_timeline.set_yticklabels([f"{name} ✓" if name in series else f"{name} ⚠"
+                                     for name in TIMELINE_TASKS],
+                                    fontsize=11, fontweight='bold')
+        timeline_title.set_text(f"Execution Timeline - Last {len(recent_jobs)} Jobs "
+                                f"(Scatter=Start, Shaded=Duration)")
         
-        ax_timeline.set_yticks(range(len(task_names_sorted)))
-        ax_timeline.set_yticklabels(ytick_labels, fontsize=11, fontweight='bold')
-        ax_timeline.set_xlabel("Time (ms)", fontsize=11, fontweight='bold')
-        ax_timeline.set_title(f"Execution Timeline - Last {len(recent_jobs)} Jobs (Scatter=Start, Shaded=Duration)", 
-                             fontsize=12, fontweight='bold', pad=10)
-        ax_timeline.grid(True, alpha=0.3, axis='x', linestyle='--', linewidth=0.7)
+        # Enhanced statistics box
+        total_jobs = len(jobs)
+        total_misses = _miss_count
+        miss_rate = (total_misses / total_jobs * 100) if total_jobs > 0 else 0
+        avg_resp = _resp_sum / total_jobs
+        avg_util = _util_sum / total_jobs
         
-        # Enhanced legend
-        from matplotlib.patches import Patch
-        from matplotlib.lines import Line2D
-        legend_elements = [
-            Line2D([0], [0], marker='o', color='w', markerfacecolor='#2ECC71', 
-                   markersize=10, label='On Time', markeredgecolor='black', markeredgewidth=1.5),
-            Line2D([0], [0], marker='o', color='w', markerfacecolor='#E74C3C', 
-                   markersize=10, label='Missed Deadline', markeredgecolor='black', markeredgewidth=1.5)
-        ]
-        ax_timeline.legend(handles=legend_elements, loc='upper right', fontsize=10, 
-                          framealpha=0.95, edgecolor='black', fancybox=True, shadow=True)
+        # Add task activity status
+        inactive_tasks = [task for task in TIMELINE_TASKS if task not in series]
         
-        # Enhanced statistics box
-        if jobs:
-            total_jobs = len(jobs)
-            total_misses = sum(1 for j in jobs if j["tardiness"] > 0)
-            miss_rate = (total_misses / total_jobs * 100) if total_jobs > 0 else 0
-            avg_resp = np.mean([j["resp_time"] for j in jobs])
-            avg_util = np.mean([j["utility"] for j in jobs])
-            
-            # Add task activity status
-            active_tasks = []
-            inactive_tasks = []
-            for task in ["Ultra", "PIR", "Sound", "Button"]:
-                if any(j["name"] == task for j in jobs):
-                    active_tasks.append(task)
-                else:
-                    inactive_tasks.append(task)
-            
-            stats_text = (f'📊 Total Jobs: {total_jobs}  |  '
-                         f'❌ Misses: {total_misses} ({miss_rate:.1f}%)  |  '
-                         f'⏱️  Avg Response: {avg_resp:.1f}ms  |  '
-                         f'📈 Avg Utility: {avg_util:.3f}')
-            
-            if inactive_tasks:
-                stats_text += f'\n⚠️  Inactive Tasks: {", ".join(inactive_tasks)} (waiting for events/button press)'
-            
-            ax_timeline.text(0.5, -0.15, stats_text, transform=ax_timeline.transAxes,
-                           fontsize=10, verticalalignment='top', ha='center',
-                           bbox=dict(boxstyle='round,pad=0.8', facecolor='#F8F9FA', 
-                                   alpha=0.95, edgecolor='black', linewidth=2),
-                           fontweight='bold')
+        stats_text = (f'📊 Total Jobs: {total_jobs}  |  '
+                     f'❌ Misses: {total_misses} ({miss_rate:.1f}%)  |  '
+                     f'⏱️  Avg Response: {avg_resp:.1f}ms  |  '
+                     f'📈 Avg Utility: {avg_util:.3f}')
+        
+        if inactive_tasks:
+            stats_text += f'\n⚠️  Inactive Tasks: {", ".join(inactive_tasks)} (waiting for events/button press)'
+        
+        timeline_stats_text.set_text(stats_text)
 
-    # Main title with better styling
-    fig.suptitle('🔴 ESP32 EDF Real-Time Scheduler - Live Performance Dashboard', 
-                 fontsize=16, fontweight='bold', y=0.995, 
-                 bbox=dict(boxstyle='round,pad=0.8', facecolor='#2C3E50', 
-                          alpha=0.9, edgecolor='white', linewidth=2),
-                 color='white')
+def draw_task_lines():
+    """Point the row 1-2 lines at the current series (downsampled) and rescale those axes."""
+    global miss_fill
+    for name, ts in series.items():
+        if not ts.n:
+            continue
+        t = ts.col("t")
+        task_line(lines_resp, ax_resp, name).set_data(*downsample_minmax(t, ts.col("resp")))
+        task_line(lines_wait, ax_wait, name).set_data(*downsample_minmax(t, ts.col("wait")))
+        task_line(lines_tard, ax_tard, name).set_data(*downsample_minmax(t, ts.col("tard")))
+        task_line(lines_util, ax_util, name).set_data(*downsample_minmax(t, ts.col("util")))
+        if period_map.get(name, 0) > 0:
+            task_line(lines_frame, ax_frame, name).set_data(*downsample_minmax(t, ts.col("frame")))
+
+    # Global average utility
+    if global_util_t:
+        global_util_line.set_data(*downsample_minmax(global_util_t, global_util_v))
+
+    # Cumulative miss rate; the fill is a collection and cannot be updated in place
+    if miss_rate_t:
+        xs, ys = downsample_minmax(miss_rate_t, miss_rate_v)
+        miss_line.set_data(xs, ys)
+        if miss_fill is not None:
+            miss_fill.remove()
+        miss_fill = ax_miss.fill_between(xs, 0, ys, alpha=0.25, color='#E74C3C')
+
+    for ax in (ax_resp, ax_wait, ax_tard, ax_util, ax_frame, ax_miss):
+        ax.relim()
+        ax.autoscale_view()
+
+# ---------- Job recording ----------
+
+# The per-job metrics are a few subtractions each, so recording is bound by moving
+# Python objects around, not by arithmetic. Each tick's completed jobs are therefore
+# handled as one batch: the metrics are NumPy vector ops and each store is extended once.
+
+def record_jobs(batch):
+    """Compute the metrics of newly completed jobs (EDF+DONE records) and store them."""
+    global _miss_count, _util_sum, _resp_sum, sorted_task_names
+    names = np.array([p["name"] for p in batch])
+    rel   = np.array([p["rel"] for p in batch])
+    start = np.array([p["start"] for p in batch])
+    dl    = np.array([p["dl"] for p in batch])
+    end_t = np.array([p["end"] for p in batch])
+
+    waiting   = start - rel
+    resp_time = end_t - rel
+    tard      = np.maximum(0, end_t - dl)
+
+    # Frame delay (for periodic tasks)
+    period = np.array([period_map.get(name) or 0 for name in names.tolist()], dtype=float)
+    periodic = period > 0
+    frame_delay = np.divide(waiting, period, out=np.full(len(batch), np.nan), where=periodic)
+
+    # Utility: soft real-time model, or hit/miss for tasks without a scale
+    scale = np.array([scale_map.get(name) or 0 for name in names.tolist()], dtype=float)
+    util = calculate_utility(tard, scale, 'soft')
+
+    # Job records, task statistics and CSV rows still need one pass per job
+    for p, w, r, t, f, u, per in zip(batch, waiting.tolist(), resp_time.tolist(), tard.tolist(),
+                                     frame_delay.tolist(), util.tolist(), periodic.tolist()):
+        p["waiting"]     = w
+        p["resp_time"]   = r
+        p["tardiness"]   = t
+        p["frame_delay"] = f if per else None
+        p["utility"]     = u
+
+        task_stats[p["name"]].record(w, t, r, u)
+
+        write_csv_row(p)
+
+    n0 = len(jobs)
+    jobs.extend(names.tolist(), waiting, tard, resp_time, util)
+    recent_jobs.extend(batch)
+
+    # time series, per task in order of completion
+    for name in dict.fromkeys(names.tolist()):
+        ts = series.get(name)
+        if ts is None:
+            ts = series[name] = TaskSeries()
+            sorted_task_names = tuple(sorted(series))
+        m = names == name
+        ts.extend(end_t[m], waiting[m], tard[m], resp_time[m], util[m], frame_delay[m])
+
+    # global miss rate and avg utility after each job; cumsum adds in job order
+    counts = np.arange(n0 + 1, len(jobs) + 1)
+    misses = _miss_count + np.cumsum(tard > 0)
+    util_sums = np.cumsum(np.concatenate(([_util_sum], util)))[1:]
+    _miss_count = int(misses[-1])
+    _util_sum = float(util_sums[-1])
+    _resp_sum += int(resp_time.sum())
+
+    t_ms = end_t.tolist()
+    miss_rate_t.extend(t_ms)
+    miss_rate_v.extend((misses / counts).tolist())
+    global_util_t.extend(t_ms)
+    global_util_v.extend((util_sums / counts).tolist())
 
-    plt.tight_layout()
+def update(frame):
+    # ---- Drain queue & parse new lines ----
+    done = []   # jobs completed this tick, recorded together below
+    while line_queue:
+        line = line_queue.popleft()
+
+        if not line:
+            continue
+
+        # The tag picks the one pattern that can match, so each line is scanned once
+        if line.startswith("EDF "):
+            m = edf_re.match(line)
+            if m:
+                name, job, rel, start, dl = m.groups()
+                job = int(job)
+                job_partial[name][job & (PARTIAL_SLOTS - 1)] = {
+                    "name":  name,
+                    "job":   job,
+                    "rel":   int(rel),
+                    "start": int(start),
+                    "dl":    int(dl),
+                }
+                task_message_count[name] += 1
+            continue
+
+        m = done_re.match(line) if line.startswith("DONE ") else None
+        if m:
+            name, job, end, val = m.groups()
+            job = int(job)
+            slots = job_partial.get(name)
+            slot = job & (PARTIAL_SLOTS - 1)
+            p = slots[slot] if slots else None
+            if not p or p["job"] != job:
+                continue  # missed EDF line, skip
+            slots[slot] = None
+            p["end"] = int(end)
+            p["val"] = int(val)
+
+            done.append(p)
+
+    if done:
+        record_jobs(done)
+
+    # print per-task summary when new jobs arrive
+    print_task_summary()
+
+    # ---- Update plots ----
+
+    # Lines only change when jobs were recorded
+    if done:
+        draw_task_lines()
+
+    # Box plots and the timeline are rebuilt from scratch, so only every few jobs
+    new_jobs = len(jobs) - _last_drawn_job_count
+    if new_jobs >= PANEL_REDRAW_JOBS or (
+            new_jobs > 0 and time.time() - _last_drawn_time >= PANEL_MAX_AGE_S):
+        draw_job_panels()
 
 def save_final_plots():
     """Save comprehensive summary plots when closing."""
+    global _last_saved_job_count
     if not jobs:
         print("No data to save.")
         return
+    if len(jobs) == _last_saved_job_count:
+        print("\n📊 No new jobs since the last save, plots are up to date.")
+        return
     
     print("\n📊 Saving final analysis plots...")
     
+    if len(jobs) != _last_drawn_job_count:
+        draw_job_panels()
+
     # Save the main dashboard
-    fig.savefig('esp32_edf_live_dashboard.png', dpi=200, bbox_inches='tight', facecolor='white')
-    print("✅ Saved: esp32_edf_live_dashboard.png (200 DPI)")
+    # A snapshot of the screen layout, so it does not need the summary's print resolution
+    fig.savefig('esp32_edf_live_dashboard.png', dpi=DASHBOARD_DPI, facecolor='white',
+                pil_kwargs={'compress_level': 1})
+    print(f"✅ Saved: esp32_edf_live_dashboard.png ({DASHBOARD_DPI} DPI)")
     
     # Create additional summary plots
     if len(jobs) > 10:
         # Per-task summary statistics with enhanced styling
-        fig2 = plt.figure(figsize=(16, 11))
-        fig2.patch.set_facecolor('white')
-        gs2 = fig2.add_gridspec(2, 2, hspace=0.35, wspace=0.3, top=0.92, bottom=0.08)
-        
-        axes2 = [
-            fig2.add_subplot(gs2[0, 0]),
-            fig2.add_subplot(gs2[0, 1]),
-            fig2.add_subplot(gs2[1, 0]),
-            fig2.add_subplot(gs2[1, 1])
-        ]
+        # Only written to PNG, so bypass pyplot and the interactive backend
+        global summary_fig
+        if summary_fig is None:
+            summary_fig = Figure(figsize=(16, 11), layout='constrained')
+            FigureCanvasAgg(summary_fig)
+            summary_fig.patch.set_facecolor('white')
+            reserve_title_box(summary_fig)
+            # All four panels have one slot per task, so they share the x axis and
+            # only the bottom row carries the task tick labels
+            summary_fig.subplots(2, 2, sharex=True)
+        else:
+            for ax in summary_fig.axes:
+                ax.clear()
+        fig2 = summary_fig
+        axes2 = fig2.axes
         
-        task_names = sorted({j["name"] for j in jobs})
+        task_names = sorted_task_names
+
+        # Per-task aggregates in one pass: index each job by its task, then bincount,
+        # mapping the table's first-appearance task ids onto the sorted task order
+        n_tasks = len(task_names)
+        position = np.empty(len(jobs.task_ids), dtype=np.intp)
+        for i, name in enumerate(task_names):
+            position[jobs.task_ids[name]] = i
+        idx = position[jobs.col("task")]
+        job_counts = np.bincount(idx, minlength=n_tasks)
+        means = {key: np.bincount(idx, weights=jobs.col(key), minlength=n_tasks) / job_counts
+                 for key in ("waiting", "tardiness", "resp_time", "utility")}
+        miss_rates = np.bincount(idx, weights=jobs.col("tardiness") > 0,
+                                 minlength=n_tasks) / job_counts * 100
+        bar_colors = [task_colors.get(name, 'gray') for name in task_names]
         
         # 1) Average metrics bar chart (grouped)
         ax1 = axes2[0]
         metrics = ['Waiting', 'Tardiness', 'Response']
-        x = np.arange(len(task_names))
+        metric_colors = ['#3498DB', '#E74C3C', '#2ECC71']
+        values = np.stack([means["waiting"], means["tardiness"], means["resp_time"]])
         width = 0.25
+        x = np.arange(n_tasks)
+        offsets = x + width * (np.arange(len(metrics))[:, None] - 1)
         
-        for i, metric in enumerate(metrics):
-            if metric == 'Waiting':
-                values = [np.mean([j["waiting"] for j in jobs if j["name"] == name]) for name in task_names]
-                color = '#3498DB'
-            elif metric == 'Tardiness':
-                values = [np.mean([j["tardiness"] for j in jobs if j["name"] == name]) for name in task_names]
-                color = '#E74C3C'
-            else:  # Response
-                values = [np.mean([j["resp_time"] for j in jobs if j["name"] == name]) for name in task_names]
-                color = '#2ECC71'
-            
-            bars = ax1.bar(x + i*width, values, width, label=metric, color=color, alpha=0.8, 
+        for metric, color, xs, vals in zip(metrics, metric_colors, offsets, values):
+            bars = ax1.bar(xs, vals, width, label=metric, color=color, alpha=0.8, 
                           edgecolor='black', linewidth=1.5)
             
             # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                if height > 0:
-                    ax1.text(bar.get_x() + bar.get_width()/2., height,
-                            f'{height:.1f}', ha='center', va='bottom', fontsize=8, fontweight='bold')
+            ax1.bar_label(bars, labels=[f'{v:.1f}' if v > 0 else '' for v in vals],
+                          fontsize=8, fontweight='bold')
         
-        ax1.set_xlabel('Task', fontsize=12, fontweight='bold')
         ax1.set_ylabel('Time (ms)', fontsize=12, fontweight='bold')
         ax1.set_title('Average Timing Metrics per Task', fontsize=13, fontweight='bold', pad=15)
-        ax1.set_xticks(x + width)
-        ax1.set_xticklabels(task_names, fontsize=11, fontweight='bold')
         ax1.legend(fontsize=10, framealpha=0.95, edgecolor='black', loc='upper left')
         ax1.grid(True, alpha=0.3, axis='y', linestyle='--')
         
         # 2) Miss rate per task
         ax2 = axes2[1]
-        miss_rates = []
-        for name in task_names:
-            task_jobs = [j for j in jobs if j["name"] == name]
-            misses = sum(1 for j in task_jobs if j["tardiness"] > 0)
-            miss_rate = misses / len(task_jobs) if task_jobs else 0
-            miss_rates.append(miss_rate * 100)
-        
-        bars = ax2.bar(task_names, miss_rates, 
-                      color=[task_colors.get(name, 'gray') for name in task_names], 
+        bars = ax2.bar(x, miss_rates, 
+                      color=bar_colors, 
                       alpha=0.85, edgecolor='black', linewidth=2)
         ax2.set_ylabel('Miss Rate (%)', fontsize=12, fontweight='bold')
         ax2.set_title('Deadline Miss Rate per Task', fontsize=13, fontweight='bold', pad=15)
-        ax2.set_ylim(0, max(miss_rates) * 1.2 if miss_rates else 100)
+        ax2.set_ylim(0, miss_rates.max(initial=0) * 1.2 or 100)   # 100 when nothing missed
         ax2.grid(True, alpha=0.3, axis='y', linestyle='--')
-        ax2.set_xticklabels(task_names, fontsize=11, fontweight='bold')
         
         # Add value labels on bars
-        for bar, rate in zip(bars, miss_rates):
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{rate:.1f}%', ha='center', va='bottom', fontsize=10, fontweight='bold')
+        ax2.bar_label(bars, fmt='%.1f%%', fontsize=10, fontweight='bold')
         
         # Add reference lines
         ax2.axhline(y=5, color='#F39C12', linestyle='--', linewidth=2, alpha=0.7, label='5% acceptable')
@@ -850,9 +1043,9 @@ def save_final_plots():
         
         # 3) Utility comparison
         ax3 = axes2[2]
-        util_avgs = [np.mean([j["utility"] for j in jobs if j["name"] == name]) for name in task_names]
-        bars = ax3.bar(task_names, util_avgs, 
-                      color=[task_colors.get(name, 'gray') for name in task_names], 
+        util_avgs = means["utility"]
+        bars = ax3.bar(x, util_avgs, 
+                      color=bar_colors, 
                       alpha=0.85, edgecolor='black', linewidth=2)
         ax3.set_ylabel('Average Utility', fontsize=12, fontweight='bold')
         ax3.set_title('Average Utility per Task', fontsize=13, fontweight='bold', pad=15)
@@ -861,48 +1054,45 @@ def save_final_plots():
         ax3.axhline(y=0.5, color='#F39C12', linestyle='--', linewidth=2, alpha=0.7, label='50% threshold')
         ax3.grid(True, alpha=0.3, axis='y', linestyle='--')
         ax3.legend(fontsize=9, framealpha=0.95, edgecolor='black')
-        ax3.set_xticklabels(task_names, fontsize=11, fontweight='bold')
         
         # Add value labels
-        for bar, util in zip(bars, util_avgs):
-            height = bar.get_height()
-            ax3.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{util:.3f}', ha='center', va='bottom', fontsize=10, fontweight='bold')
+        ax3.bar_label(bars, fmt='%.3f', fontsize=10, fontweight='bold')
         
         # 4) Job count distribution
         ax4 = axes2[3]
-        job_counts = [len([j for j in jobs if j["name"] == name]) for name in task_names]
-        bars = ax4.bar(task_names, job_counts, 
-                      color=[task_colors.get(name, 'gray') for name in task_names], 
+        bars = ax4.bar(x, job_counts, 
+                      color=bar_colors, 
                       alpha=0.85, edgecolor='black', linewidth=2)
         ax4.set_ylabel('Number of Jobs', fontsize=12, fontweight='bold')
         ax4.set_title('Job Distribution per Task', fontsize=13, fontweight='bold', pad=15)
         ax4.grid(True, alpha=0.3, axis='y', linestyle='--')
-        ax4.set_xticklabels(task_names, fontsize=11, fontweight='bold')
         
         # Add value labels
-        for bar, count in zip(bars, job_counts):
-            height = bar.get_height()
-            ax4.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{count}', ha='center', va='bottom', fontsize=10, fontweight='bold')
+        ax4.bar_label(bars, fontsize=10, fontweight='bold')
+        
+        # Shared task axis: the ticker is common to all four, the labels show on the bottom row
+        ax4.set_xticks(x)
+        for ax in (ax3, ax4):
+            ax.set_xticklabels(task_names, fontsize=11, fontweight='bold')
+            ax.set_xlabel('Task', fontsize=12, fontweight='bold')
         
         # Global title
         fig2.suptitle('🔴 ESP32 EDF Scheduler - Task Performance Summary', 
-                     fontsize=16, fontweight='bold',
-                     bbox=dict(boxstyle='round,pad=0.8', facecolor='#2C3E50', 
-                              alpha=0.9, edgecolor='white', linewidth=2),
+                     fontsize=TITLE_FONTSIZE, fontweight='bold',
+                     bbox=TITLE_BBOX,
                      color='white')
         
-        fig2.savefig('esp32_edf_task_summary.png', dpi=200, bbox_inches='tight', facecolor='white')
+        fig2.savefig('esp32_edf_task_summary.png', dpi=200, facecolor='white')
         print("✅ Saved: esp32_edf_task_summary.png (200 DPI)")
-        plt.close(fig2)
     
+    csv_queue.join()   # let the writer thread flush the remaining rows
+    _last_saved_job_count = len(jobs)
     print(f"\n✅ Final CSV exported to: {csv_filename}")
     print(f"📈 Total jobs recorded: {len(jobs)}")
     print("🎉 All visualizations saved successfully!\n")
 
-# Set up animation
-ani = FuncAnimation(fig, update, interval=500)
+# Set up animation; frames are an endless counter, so there is nothing worth caching
+ani = FuncAnimation(fig, update, interval=500, cache_frame_data=False)
 
 # Handle window close to save plots
 def on_close(event):
@@ -0,0 +1,35 @@
+import unittest
+
+from new import RTScheduler, Task
+
+
+def finish_times(results, *names):
+    """Map job name -> (start, finish) for the jobs of the given tasks"""
+    return {str(job): (job.start_time, job.finish_time)
+            for job in results['completed_jobs'] if job.task.name in names}
+
+
+class RMTieTest(unittest.TestCase):
+    def test_preempted_job_queues_behind_equal_priority_job(self):
+        # A and B share a period; H preempts A at t=5 while B is still waiting,
+        # so B runs next and A only resumes once H preempts B in turn
+        tasks = [Task('H', 5, 1, 5), Task('A', 20, 6, 20), Task('B', 20, 6, 20)]
+        results = RTScheduler(tasks, 20).schedule_rm()
+        self.assertEqual(finish_times(results, 'A', 'B'),
+                         {'A_1': (1, 13), 'B_1': (6, 15)})
+
+
+class EDFTieTest(unittest.TestCase):
+    def test_equal_deadlines_served_in_push_order_under_overload(self):
+        # U = 0.25 + 0.4 + 0.4 > 1 and A and B share every absolute deadline.
+        # A is released first so it runs first; each C job preempts the running one
+        # and requeues it behind the other, so A and B take turns between C's jobs
+        tasks = [Task('C', 4, 1, 2), Task('A', 20, 8, 20), Task('B', 20, 8, 20)]
+        results = RTScheduler(tasks, 20).schedule_edf()
+        self.assertEqual(finish_times(results, 'A', 'B'),
+                         {'A_1': (1, 19), 'B_1': (5, 21)})
+        self.assertGreater(results['missed_deadlines'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()